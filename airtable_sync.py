@@ -0,0 +1,193 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from atomic_file import atomic_write
+from match_cache import DEFAULT_CACHE_DIR
+
+AIRTABLE_URL = "https://api.airtable.com/v0"
+
+# Edits made while a sync is running (or on a server whose clock is a little ahead) are caught
+# by starting the next incremental fetch this far before the previous one began
+SYNC_OVERLAP = timedelta(minutes=5)
+
+# Airtable has no ID-only listing, so the view's record IDs are listed with just this one short
+# field to keep the pages small
+ID_LISTING_FIELD = "First Name"
+
+
+class AirtableSnapshot:
+    """
+    Local copy of the records in an Airtable view, saved as JSON.
+
+    Records are keyed by record ID and kept as Airtable returns them (id, createdTime, fields).
+    The snapshot also remembers the view's record order and when it was last synced, so the
+    next sync only has to ask Airtable for records modified since then.
+    """
+    def __init__(self, base_id, table_name, view_name, cache_dir=DEFAULT_CACHE_DIR):
+        directory = os.path.join(cache_dir, 'airtable')
+        os.makedirs(directory, exist_ok=True)
+        filename = "_".join(part.replace(os.sep, '-') for part in (base_id, table_name, view_name))
+        self.path = os.path.join(directory, f"{filename}.json")
+        self.records = {}
+        # Record IDs in view order, as of the last sync
+        self.order = []
+        self.synced_at = None
+
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                data = json.load(f)
+            self.records = data["records"]
+            self.synced_at = datetime.fromisoformat(data["synced_at"]) if data.get("synced_at") else None
+            # Snapshots saved before the order was kept fall back to creation order
+            self.order = data.get("order") or sorted(
+                self.records, key=lambda record_id: (self.records[record_id].get("createdTime", ""), record_id))
+
+    def exists(self):
+        return self.synced_at is not None
+
+    def update(self, records, synced_at, full=False, view_ids=None):
+        """
+        Merges fetched records into the snapshot.
+
+        A full fetch replaces the snapshot and takes its order from the fetched records.
+        Otherwise records are updated by ID. With view_ids, the IDs currently in the view in
+        view order, records that have left the view are dropped and the order is rebuilt from
+        the listing, so it matches what a full fetch would give.
+
+        Returns:
+            int: Number of records dropped.
+        """
+        if full:
+            self.records = {}
+            self.order = []
+        for record in records:
+            if record["id"] not in self.records:
+                self.order.append(record["id"])
+            self.records[record["id"]] = record
+
+        dropped = 0
+        if view_ids is not None:
+            in_view = set(view_ids)
+            for record_id in [record_id for record_id in self.records if record_id not in in_view]:
+                del self.records[record_id]
+                dropped += 1
+            self.order = [record_id for record_id in view_ids if record_id in self.records]
+
+        self.synced_at = synced_at
+        return dropped
+
+    def save(self):
+        with atomic_write(self.path) as f:
+            json.dump({"synced_at": self.synced_at.isoformat() if self.synced_at else None,
+                       "order": self.order,
+                       "records": self.records}, f)
+
+    def ordered_records(self):
+        """
+        Returns the records in view order.
+        """
+        return [self.records[record_id] for record_id in self.order]
+
+
+def fetch_airtable_records(session, base_id, table_name, view_name, modified_since=None,
+                           base_url=AIRTABLE_URL, max_records=1000, fields=None):
+    """
+    Fetches records from an Airtable view, following offset pagination.
+
+    Parameters:
+        session (requests.Session): Session carrying the Authorization header
+        base_id (str): Airtable base ID
+        table_name (str): Name of the table in Airtable
+        view_name (str): Name of the view to fetch from
+        modified_since (datetime): If given, only records modified after this time are fetched
+        base_url (str): API root, replaceable with a stub server
+        fields (list): If given, only these fields are returned for each record
+
+    Returns:
+        list: Raw record dicts.
+    """
+    url = f"{base_url}/{base_id}/{table_name}"
+    params = {
+        "view": view_name,
+        "maxRecords": max_records
+    }
+    if modified_since is not None:
+        since = modified_since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        params["filterByFormula"] = f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{since}'))"
+    if fields is not None:
+        params["fields[]"] = fields
+
+    all_records = []
+    offset = None
+
+    # Handle pagination
+    while True:
+        if offset:
+            params["offset"] = offset
+
+        response = session.get(url, params=params)
+        response.raise_for_status()
+
+        data = response.json()
+        all_records.extend(data.get("records", []))
+
+        offset = data.get("offset")
+        if not offset:
+            break
+
+    return all_records
+
+
+def fetch_airtable_record_ids(session, base_id, table_name, view_name, base_url=AIRTABLE_URL):
+    """
+    Returns the IDs of every record in an Airtable view, in view order.
+    """
+    records = fetch_airtable_records(session, base_id, table_name, view_name, base_url=base_url,
+                                     fields=[ID_LISTING_FIELD])
+    return [record["id"] for record in records]
+
+
+def sync_airtable_snapshot(base_id, table_name, view_name, access_token=None, offline=False, full=False,
+                           cache_dir=DEFAULT_CACHE_DIR, base_url=AIRTABLE_URL, session=None):
+    """
+    Brings the local snapshot of an Airtable view up to date and returns it.
+
+    The first sync (or one with full=True) downloads the whole view. Later syncs only fetch
+    records modified since the previous sync and merge them in by record ID, then list the
+    record IDs still in the view and drop the rest, so lapsed or deleted members disappear on
+    every sync. With offline=True nothing is fetched and the snapshot is used as it is.
+
+    Returns:
+        AirtableSnapshot: The updated snapshot.
+    """
+    snapshot = AirtableSnapshot(base_id, table_name, view_name, cache_dir)
+
+    if offline:
+        if not snapshot.exists():
+            raise FileNotFoundError(f"No Airtable snapshot at {snapshot.path}; run once online first")
+        print(f"Using Airtable snapshot from {snapshot.synced_at} ({len(snapshot.records)} records)")
+        return snapshot
+
+    if session is None:
+        import requests
+
+        session = requests.Session()
+    if access_token:
+        session.headers.update({
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        })
+
+    full = full or not snapshot.exists()
+    started_at = datetime.now(timezone.utc)
+    modified_since = None if full else snapshot.synced_at - SYNC_OVERLAP
+    records = fetch_airtable_records(session, base_id, table_name, view_name, modified_since, base_url)
+    # Listed after the changes, so a record that leaves the view meanwhile is still dropped
+    view_ids = None if full else fetch_airtable_record_ids(session, base_id, table_name, view_name, base_url)
+
+    dropped = snapshot.update(records, started_at, full=full, view_ids=view_ids)
+    snapshot.save()
+    print(f"Fetched {len(records)} {'' if full else 'changed '}Airtable records, dropped {dropped} "
+          f"({len(snapshot.records)} in snapshot)")
+    return snapshot
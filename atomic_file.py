@@ -0,0 +1,27 @@
+import contextlib
+import os
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode='w'):
+    """
+    Opens a temporary file next to path for writing and moves it over path once the block
+    finishes, so readers never see a half-written file. If the block raises, the temporary
+    file is removed and path is left as it was. Missing parent directories are created.
+
+    Parameters:
+        path (str): File to write.
+        mode (str): 'w' for text or 'wb' for bytes.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
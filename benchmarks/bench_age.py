@@ -0,0 +1,84 @@
+"""
+Compares the ways of computing a member's age on race day inside the matching loop.
+
+  relativedelta   relativedelta(race_date, member.birth_date).years, as matching used to do
+  age_on          Member.age_on, integer arithmetic on the precomputed birth date tuple
+  member_ages     Club.member_ages, one list per race date, so each lookup is an index
+
+Prints a JSON summary with nanoseconds per lookup.
+
+    python benchmarks/bench_age.py
+    python benchmarks/bench_age.py --members 5000 --lookups 500000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dateutil.relativedelta import relativedelta
+
+import synthetic
+
+
+def ns_per_lookup(fn, lookups):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) / lookups * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time per-lookup age computation")
+    parser.add_argument('--members', type=int, default=2000)
+    parser.add_argument('--lookups', type=int, default=200_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    club = synthetic.make_club(synthetic.make_people(args.members, args.seed))
+    race_date = datetime.combine(date(2025, 6, 14), datetime.min.time())
+    names = list(club.members)
+    rng = random.Random(args.seed)
+    picks = [rng.randrange(len(names)) for _ in range(args.lookups)]
+    members = [club.members[names[i]] for i in picks]
+
+    def with_relativedelta():
+        for member in members:
+            relativedelta(race_date, member.birth_date).years
+
+    def with_age_on():
+        for member in members:
+            member.age_on(race_date)
+
+    def with_member_ages():
+        ages = club.member_ages(race_date)
+        for i in picks:
+            ages[i]
+
+    expected = [relativedelta(race_date, m.birth_date).years for m in members]
+    ages = club.member_ages(race_date)
+    assert [m.age_on(race_date) for m in members] == expected
+    assert [ages[i] for i in picks] == expected
+
+    # Drop the cached list so the member_ages timing includes building it once
+    club._ages_by_race.clear()
+    timings = {
+        'relativedelta': ns_per_lookup(with_relativedelta, args.lookups),
+        'age_on': ns_per_lookup(with_age_on, args.lookups),
+        'member_ages': ns_per_lookup(with_member_ages, args.lookups),
+    }
+    report = {
+        'members': args.members,
+        'lookups': args.lookups,
+        'ns_per_lookup': timings,
+        'speedup_age_on': timings['relativedelta'] / timings['age_on'],
+        'speedup_member_ages': timings['relativedelta'] / timings['member_ages'],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Tracks cold start time for importing the pipeline modules.
+
+Each sample imports the module in a fresh interpreter, so nothing is shared between runs.
+Prints a JSON summary, and with --importtime also the slowest modules from -X importtime.
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --module member --runs 20 --importtime
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_import(module, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', f'import {module}'], cwd=REPO_ROOT, check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def slowest_imports(module, count=10):
+    """
+    Returns the modules with the largest cumulative import time, in microseconds.
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=REPO_ROOT, check=True, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # Lines look like "import time:  self_us | cumulative_us | module"
+        _, cumulative_us, name = line.split('|')
+        rows.append((int(cumulative_us), name.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time")
+    parser.add_argument('--module', default='gp')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--importtime', action='store_true', help="Also list the slowest imports")
+    args = parser.parse_args()
+
+    # A bare interpreter start, to separate our imports from Python's own startup
+    baseline = time_import('sys', args.runs)
+    samples = time_import(args.module, args.runs)
+    report = {
+        'module': args.module,
+        'runs': args.runs,
+        'min_s': min(samples),
+        'median_s': statistics.median(samples),
+        'baseline_median_s': statistics.median(baseline),
+        'import_median_s': statistics.median(samples) - statistics.median(baseline),
+    }
+    if args.importtime:
+        report['slowest_us'] = [{'module': name, 'cumulative_us': us} for us, name in slowest_imports(args.module)]
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
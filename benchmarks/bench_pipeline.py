@@ -0,0 +1,185 @@
+"""
+Times each stage of the Grand Prix pipeline on synthetic data (see synthetic.py).
+
+Stages:
+  extract_pdf, extract_raceresult, extract_athlinks, extract_csv
+                          parse the same finishers from each results format
+  get_member              match every finisher one at a time
+  merge_members           merge a second membership export into the roster
+  process_gp_points       match and score one race
+  generate_gp_results_pdf render the standings for a season of races with the vector backend
+  generate_gp_results_pdf_matplotlib
+                          the same with the matplotlib backend
+
+Each stage runs --repeat times on fresh inputs. The JSON report records the commit, the sizes
+used and the min/median seconds per stage, so runs can be compared between commits.
+
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --finishers 5000 --members 3000 --output bench.json
+    python benchmarks/bench_pipeline.py --stages get_member process_gp_points
+"""
+import argparse
+import contextlib
+import copy
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic
+from synthetic import REPO_ROOT
+
+STAGES = ['extract_pdf', 'extract_raceresult', 'extract_athlinks', 'extract_csv', 'get_member',
+          'merge_members', 'process_gp_points', 'generate_gp_results_pdf', 'generate_gp_results_pdf_matplotlib']
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextlib.contextmanager
+def quiet():
+    # Several stages print per row; keep that out of the timings' output
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(run, repeat, setup=None):
+    """
+    Times run(state) repeat times, calling setup() untimed before each run for fresh inputs.
+    """
+    samples = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        with quiet():
+            start = time.perf_counter()
+            run(state)
+            samples.append(time.perf_counter() - start)
+    return {'runs_s': samples, 'min_s': min(samples), 'median_s': statistics.median(samples)}
+
+
+def race_dates(count):
+    year = date.today().year
+    return [datetime(year, 4 + i % 6, 1 + (7 * i) % 28) for i in range(count)]
+
+
+def make_race(name, race_date):
+    from gp import Race
+
+    return Race({'name': name, 'file': f'{name}.json', 'date': race_date, 'results_type': 'raceresult'})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the parse, match and score stages")
+    parser.add_argument('--finishers', type=int, default=2000, help="Finishers per race")
+    parser.add_argument('--members', type=int, default=1500, help="Roster size")
+    parser.add_argument('--races', type=int, default=6, help="Races in the season rendered to PDF")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--output', help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    from gp import process_gp_points
+    import parse
+
+    workdir = tempfile.mkdtemp(prefix='gp-bench-')
+    people = synthetic.make_people(args.members, args.seed)
+    dates = race_dates(max(args.races, 1))
+    rows = synthetic.make_finishers(people, args.finishers, dates[0], args.seed)
+    paths = synthetic.write_race_files(workdir, rows)
+    club = synthetic.make_club(people)
+    with quiet():
+        base_results = parse.extract_results_from_raceresult(paths['raceresult'])
+
+    stages = {}
+    extractors = {
+        'extract_pdf': lambda _: parse.extract_results_from_pdf(paths['pdf'], None),
+        'extract_raceresult': lambda _: parse.extract_results_from_raceresult(paths['raceresult']),
+        'extract_athlinks': lambda _: parse.extract_results_from_athlinks(paths['athlinks']),
+        'extract_csv': lambda _: parse.extract_results_from_csv(paths['csv']),
+    }
+    for stage, run in extractors.items():
+        if stage in args.stages:
+            stages[stage] = measure(run, args.repeat)
+
+    if 'get_member' in args.stages:
+        queries = [(r.age, r.name) for r in base_results]
+
+        def get_members(_):
+            for age, name in queries:
+                club.get_member(age, name, dates[0], threshold=85)
+
+        stages['get_member'] = measure(get_members, args.repeat)
+        stages['get_member']['per_lookup_us'] = stages['get_member']['min_s'] / len(queries) * 1e6
+
+    if 'merge_members' in args.stages:
+        incoming = synthetic.make_incoming_members(people, args.members, args.seed + 2)
+        stages['merge_members'] = measure(lambda state: state[0].merge_members(state[1]), args.repeat,
+                                          setup=lambda: (synthetic.make_club(people), copy.deepcopy(incoming)))
+
+    if 'process_gp_points' in args.stages:
+        race = make_race('race0', dates[0])
+
+        def fresh_race():
+            for member in club.members.values():
+                member.results = []
+            return copy.deepcopy(base_results)
+
+        stages['process_gp_points'] = measure(lambda results: process_gp_points(results, club, race), args.repeat,
+                                              setup=fresh_race)
+
+    pdf_backends = {'generate_gp_results_pdf': 'vector', 'generate_gp_results_pdf_matplotlib': 'matplotlib'}
+    if any(stage in args.stages for stage in pdf_backends):
+        # Score a whole season once, then time only the rendering
+        season_club = synthetic.make_club(people)
+        races = []
+        with quiet():
+            for i, race_date in enumerate(dates[:args.races]):
+                race = make_race(f'race{i}', race_date)
+                race_rows = synthetic.make_finishers(people, args.finishers, race_date, args.seed + i)
+                path = os.path.join(workdir, f'season{i}.json')
+                synthetic.write_raceresult_json(path, race_rows)
+                results = parse.extract_results(race, i, path)
+                process_gp_points(results, season_club, race)
+                races.append(race)
+        divisions = len(season_club._prepare_division_data(races))
+        for stage, backend in pdf_backends.items():
+            if stage not in args.stages:
+                continue
+            pdf_path = os.path.join(workdir, f'gp_results_{backend}.pdf')
+            stages[stage] = measure(
+                lambda _: season_club.generate_gp_results_pdf(races, pdf_path, backend=backend), args.repeat)
+            stages[stage]['divisions'] = divisions
+
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'finishers': args.finishers,
+        'members': args.members,
+        'races': args.races,
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'stages': stages,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+
+
+if __name__ == '__main__':
+    main()
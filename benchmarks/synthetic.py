@@ -0,0 +1,260 @@
+"""
+Synthetic race data for the benchmarks.
+
+Builds a member roster and race fields of any size, and writes the fields in every format
+parse.py reads: text PDF, raceresult JSON, Athlinks JSON and the CSV export. Everything is
+seeded, so the same arguments always give the same files.
+
+    python benchmarks/synthetic.py /tmp/synthetic --finishers 2000 --members 1500
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+FIRST_NAMES = ['james', 'mary', 'john', 'patricia', 'robert', 'jennifer', 'michael', 'linda', 'david',
+               'elizabeth', 'william', 'barbara', 'richard', 'susan', 'joseph', 'jessica', 'thomas', 'sarah',
+               'chris', 'karen', 'daniel', 'lisa', 'matthew', 'nancy', 'anthony', 'betty', 'mark', 'sandra',
+               'paul', 'ashley', 'steven', 'emily', 'andrew', 'donna', 'joshua', 'michelle', 'kevin', 'carol',
+               'brian', 'amanda', 'george', 'melissa', 'timothy', 'deborah', 'ryan', 'stephanie', 'jacob',
+               'rebecca', 'gary', 'laura', 'nicholas', 'sharon', 'eric', 'cynthia', 'abdullahi', 'zoë', 'josé']
+SYLLABLES = ['an', 'ber', 'son', 'ski', 'lee', 'mar', 'tin', 'ga', 'ro', 'nel', 'sen', 'ham', 'wick', 'ols',
+             'van', 'der', 'mc', 'ken', 'zie', 'ber', 'g', 'ova', 'hu', 'yen', 'o', 'neil', 'dahl', 'quist']
+CITIES = [('Rochester', 'MN'), ('Stewartville', 'MN'), ('Byron', 'MN'), ('Kasson', 'MN'), ('Winona', 'MN'),
+          ('La Crosse', 'WI'), ('Eau Claire', 'WI'), ('Des Moines', 'IA')]
+
+
+def _last_name(rng):
+    return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+
+
+def _typo(text, rng):
+    i = rng.randrange(len(text))
+    return text[:i] + rng.choice('aeiou') + text[i + 1:]
+
+
+def make_people(count, seed=0, nonbinary_share=0.04):
+    """
+    Returns count people as dicts with first, last, gender ('M', 'F' or 'N') and birth_date.
+    """
+    rng = random.Random(seed)
+    people = []
+    for _ in range(count):
+        people.append({
+            'first': rng.choice(FIRST_NAMES).title(),
+            'last': _last_name(rng).title(),
+            'gender': 'N' if rng.random() < nonbinary_share else rng.choice('MF'),
+            'birth_date': datetime(1935, 1, 1) + timedelta(days=rng.randrange(80 * 365)),
+        })
+    return people
+
+
+def make_club(people):
+    """
+    Returns a Club with an active member for each person. Birth dates are left out for a few
+    members, as happens in the real exports.
+    """
+    from member import Club, Member
+
+    club = Club()
+    year = date.today().year
+    # Member prints its division as it's built
+    with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+        for i, person in enumerate(people):
+            birth_date = None if i % 23 == 0 else person['birth_date']
+            member = Member(f'{year}-01-15', person['first'], person['last'], birth_date,
+                            person['gender'], 'Renew 1 Year', start_year=year, end_year=year)
+            club.members[member.name] = member
+    return club
+
+
+def make_incoming_members(people, count, seed=0):
+    """
+    Returns a {raw name: Member} dict like a second membership export: about half are people
+    already in people (some with a typo in the last name), the rest are new.
+    """
+    from member import Member
+
+    rng = random.Random(seed)
+    year = date.today().year
+    strangers = make_people(count, seed + 1)
+    incoming = {}
+    with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+        for i in range(count):
+            person = rng.choice(people) if rng.random() < 0.5 else strangers[i]
+            last = _typo(person['last'], rng) if rng.random() < 0.2 else person['last']
+            member = Member(f'{year}-02-01', person['first'], last, person['birth_date'], person['gender'],
+                            rng.choice(['', 'Renew 1 Year']), start_year=year, end_year=year)
+            incoming[f"{person['first']} {last} {i}"] = member
+    return incoming
+
+
+def make_finishers(people, count, race_date, seed=0, member_share=0.4):
+    """
+    Returns count finisher rows in place order. About member_share of them are roster people,
+    with their age on race_date and now and then a typo or a missing age; the rest are strangers.
+    """
+    rng = random.Random(seed)
+    strangers = make_people(count, seed + 1)
+    seconds = 1000
+    rows = []
+    for place in range(1, count + 1):
+        person = rng.choice(people) if rng.random() < member_share else strangers[place - 1]
+        first, last = person['first'], person['last']
+        if rng.random() < 0.1:
+            last = _typo(last, rng)
+        age = race_date.year - person['birth_date'].year - (
+            (race_date.month, race_date.day) < (person['birth_date'].month, person['birth_date'].day))
+        seconds += rng.randint(0, 12)
+        city, state = rng.choice(CITIES)
+        rows.append({
+            'place': place,
+            'first': first,
+            'last': last,
+            'seconds': seconds,
+            'age': None if rng.random() < 0.03 else max(age, 5),
+            'gender': person['gender'],
+            'city': city,
+            'state': state,
+        })
+    return rows
+
+
+def format_time(seconds):
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+def format_pace(seconds, miles=3.1):
+    return format_time(round(seconds / miles))
+
+
+def write_pdf(path, pages, font_size=9, page_size=(612, 792)):
+    """
+    Writes a PDF of plain positioned Helvetica text.
+
+    Parameters:
+        pages (list): One list per page of (x, y from the top, text) tuples.
+    """
+    from pdf_tables import PdfCanvas
+
+    canvas = PdfCanvas(page_size)
+    for number, words in enumerate(pages):
+        if number:
+            canvas.new_page()
+        for x, y, text in words:
+            canvas.text(x, canvas.height - y - font_size, text, font_size)
+    canvas.save(path)
+
+
+def write_results_pdf(path, rows, per_page=60):
+    """
+    Writes finishers as a results PDF laid out like the timing companies' text exports.
+    """
+    columns = [('Place', 30), ('Name', 70), ('Time', 270), ('Pace', 320), ('Age', 370), ('S', 400),
+               ('City', 430), ('State', 540)]
+    pages = []
+    for start in range(0, len(rows), per_page):
+        words = [(40, 30, 'Results ======= Overall')]
+        words += [(x, 60, title) for title, x in columns]
+        y = 80
+        for row in rows[start:start + per_page]:
+            values = [str(row['place']), f"{row['first']} {row['last']}", format_time(row['seconds']),
+                      format_pace(row['seconds']), str(row['age'] or 0), row['gender'], row['city'], row['state']]
+            for (_, x), value in zip(columns, values):
+                # One word per text object, as PDF text extraction sees it
+                for word in value.split():
+                    words.append((x, y, word))
+                    x += len(word) * 5 + 5
+            y += 11
+        pages.append(words)
+    write_pdf(path, pages)
+
+
+def write_raceresult_json(path, rows):
+    fields = ['BIB', 'WithStatus([AUTORANK.p])', 'FLNAME', 'Finish.GUN', 'PACE', 'GenderMF', 'AGE', 'CITY', 'STATE2']
+    data = []
+    for i, row in enumerate(rows):
+        # Mix the two name orders raceresult uses
+        name = f"{row['last']}, {row['first']}" if i % 2 else f"{row['first']} {row['last']}"
+        data.append([str(100 + i), f"{row['place']}.", name, format_time(row['seconds']), format_pace(row['seconds']),
+                     row['gender'], '' if row['age'] is None else str(row['age']), row['city'], row['state']])
+    with open(path, 'w') as f:
+        json.dump({'list': {}, 'DataFields': fields, 'data': data}, f)
+
+
+def write_athlinks_json(path, rows):
+    data = [{
+        'rankings': {'overall': row['place']},
+        'displayName': f"{row['first']} {row['last']}",
+        'chipTimeInMillis': row['seconds'] * 1000,
+        'age': row['age'] or 0,
+        'gender': row['gender'],
+        'location': {'locality': row['city'], 'region': row['state']},
+    } for row in rows]
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+def write_results_csv(path, rows):
+    # The export only has female and male sections; everyone else is listed with the males
+    labels = {'F': 'female', 'M': 'male', 'N': 'nonbinary'}
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for genders, section in (('F', 'All females'), ('MN', 'All males')):
+            writer.writerow(['Place', '', 'Time', 'Name', 'Age', 'Gender'])
+            writer.writerow([section, '', '', '', '', ''])
+            for row in rows:
+                if row['gender'] in genders:
+                    writer.writerow([row['place'], '', format_time(row['seconds']), f"{row['first']} {row['last']}",
+                                     '' if row['age'] is None else row['age'], labels[row['gender']]])
+
+
+WRITERS = {
+    'pdf': ('pdf', write_results_pdf),
+    'raceresult': ('json', write_raceresult_json),
+    'athlinks': ('json', write_athlinks_json),
+    'csv': ('csv', write_results_csv),
+}
+
+
+def write_race_files(directory, rows, name='race'):
+    """
+    Writes the same finishers in every format. Returns results type -> file path.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for results_type, (extension, writer) in WRITERS.items():
+        path = os.path.join(directory, f"{name}_{results_type}.{extension}")
+        writer(path, rows)
+        paths[results_type] = path
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write synthetic results files in every supported format")
+    parser.add_argument('directory')
+    parser.add_argument('--finishers', type=int, default=2000)
+    parser.add_argument('--members', type=int, default=1500)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    people = make_people(args.members, args.seed)
+    rows = make_finishers(people, args.finishers, date(date.today().year, 6, 14), args.seed)
+    paths = write_race_files(args.directory, rows)
+    roster_path = os.path.join(args.directory, 'members.csv')
+    make_club(people).write_members_to_csv(roster_path)
+    paths['members'] = roster_path
+    print(json.dumps(paths, indent=2))
+
+
+if __name__ == '__main__':
+    main()
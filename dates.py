@@ -0,0 +1,136 @@
+import calendar
+import re
+from collections import Counter
+from datetime import date, datetime
+from functools import lru_cache
+
+# Formats that cover nearly every date in the membership exports. Anything else goes to dateparser.
+_ISO_RE = re.compile(r'(\d{4})([-/])(\d{1,2})\2(\d{1,2})(?:[ T](\d{1,2}):(\d{2})(?::(\d{2}))?)?')
+_US_RE = re.compile(r'(\d{1,2})([-/])(\d{1,2})\2(\d{4})(?: (\d{1,2}):(\d{2})(?::(\d{2}))?)?')
+_MONTH_NAME_RE = re.compile(r'([A-Za-z]+)\.?[\s/,-]+(\d{1,2})(?:st|nd|rd|th)?[\s/,-]+(\d{4})')
+
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({abbr.lower(): number for number, abbr in enumerate(calendar.month_abbr) if abbr})
+_MONTHS['sept'] = 9
+
+# How each call was answered: 'memo' (repeat string), 'empty', 'fast' (regex), 'dateparser' (slow path)
+date_parse_stats = Counter()
+
+
+def _build(year, month, day, hour=None, minute=None, second=None):
+    try:
+        return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(text):
+    """
+    Returns (datetime or None, path taken) for a stripped date string.
+    """
+    if not text:
+        return None, 'empty'
+
+    match = _ISO_RE.fullmatch(text)
+    if match:
+        year, _, month, day, hour, minute, second = match.groups()
+        parsed = _build(year, month, day, hour, minute, second)
+        if parsed is not None:
+            return parsed, 'fast'
+
+    match = _US_RE.fullmatch(text)
+    if match:
+        month, _, day, year, hour, minute, second = match.groups()
+        parsed = _build(year, month, day, hour, minute, second)
+        if parsed is not None:
+            return parsed, 'fast'
+
+    match = _MONTH_NAME_RE.fullmatch(text)
+    if match and match.group(1).lower() in _MONTHS:
+        month_name, day, year = match.groups()
+        parsed = _build(year, _MONTHS[month_name.lower()], day)
+        if parsed is not None:
+            return parsed, 'fast'
+
+    # Free-form input: fall back to dateparser, which is slow but understands nearly anything
+    import dateparser
+
+    return dateparser.parse(text), 'dateparser'
+
+
+def parse_date(text):
+    """
+    Drop-in replacement for dateparser.parse on membership data.
+
+    Common numeric and month-name formats are parsed with precompiled regexes, reading numeric
+    dates month first as dateparser does. Results are memoized per string, and only input that
+    matches none of the fast formats (or isn't a valid date in them) reaches dateparser.
+
+    Parameters:
+        text (str): Date string. None or blank gives None.
+
+    Returns:
+        datetime: Parsed date, or None if it couldn't be parsed.
+    """
+    if text is None:
+        date_parse_stats['empty'] += 1
+        return None
+
+    hits_before = _parse_date.cache_info().hits
+    parsed, path = _parse_date(text.strip())
+    date_parse_stats['memo' if _parse_date.cache_info().hits > hits_before else path] += 1
+    return parsed
+
+
+def print_date_parse_stats():
+    total = sum(date_parse_stats.values())
+    print(f"Parsed {total} dates: " + ", ".join(f"{path} {count}" for path, count in sorted(date_parse_stats.items())))
+
+
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year, month):
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month]
+
+
+def date_key(value):
+    """
+    Integer tuple (year, month, day, time of day in microseconds) for a date or datetime,
+    or None for None. A plain date counts as midnight, as relativedelta treats it.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        tod = ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
+        return value.year, value.month, value.day, tod
+    if isinstance(value, date):
+        return value.year, value.month, value.day, 0
+    raise TypeError(f"Expected a date or datetime, got {type(value).__name__}")
+
+
+def age_between(on, born):
+    """
+    Whole years from born to on, both date_key tuples. Equal to
+    relativedelta(on, born).years, including its month-end clipping (a Feb 29 birthday
+    falls on Feb 28 in common years) and rounding toward zero when on is before born.
+    None for either date gives 0, as relativedelta does.
+    """
+    if on is None or born is None:
+        return 0
+    y1, m1, d1, t1 = on
+    y2, m2, d2, t2 = born
+    months = (y1 - y2) * 12 + (m1 - m2)
+
+    # born + months lands in on's month, on the birth day clipped to that month's length
+    day = d2 if d2 <= 28 else min(d2, _days_in_month(y1, m1))
+    if (y1, m1, d1, t1) >= (y2, m2, d2, t2):
+        if (d1, t1) < (day, t2):
+            months -= 1
+    elif (d1, t1) > (day, t2):
+        months += 1
+
+    return months // 12 if months >= 0 else -(-months // 12)
@@ -1,14 +1,22 @@
 import yaml
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
-from parse import extract_results, Result
+from parse import extract_results, clear_results_cache, Result
 from member import Club, Member
-from collections import defaultdict
+from race_store import RaceStore, race_key, scoring_fingerprint
+from scoring import score_divisions
+from itertools import islice
 import os
 import string
 
+DEFAULT_RACES_YAML = "/home/joseph/race-results/2025_races.yml"
+DEFAULT_INGEST_LOCATION = "/home/joseph/race-results/ingest"
+
 # Define a Race class to organize data neatly
 class Race:
     def __init__(self, race_data):
+        self.entry        = race_data
         self.name         = race_data['name']
         if 'male_file' in race_data:
             self.gender_files = True
@@ -20,6 +28,7 @@ class Race:
 
         self.date         = race_data['date']
         self.results_type = race_data['results_type']
+        self.match_calls  = 0
 
     def __str__(self):
         return f"Race(name='{self.name}', file='{self.file}')"
@@ -48,61 +57,165 @@ def load_gp_data(yaml_path: str):
     year = int(data.get('year'))
     return races, year, latest_race
 
-# Modifies results in place to set membership status of each finisher
-def process_gp_points(results: list[Result], club: Club, race: Race):
-    divisions = defaultdict(list)
-
-    # Establish whether each result corresponds to a member
-    for r in results:
-        member = club.get_member(r.age, r.name, race.date, threshold=85)
-        r.set_membership(member, race.date)
-        r.set_division()
-
-        # A particular result can have a null division if their age or gender is not present and can't 
-        # be inferred by membership
-        if r.division is not None:
-            divisions[r.division].append(r)
-
-
-    for division, group in sorted(divisions.items()):
-        group.sort(key=lambda r: r.place)
-
-        for i, runner in enumerate(group, 1):
-            if runner.is_member:
-                runner.points = max(0, 11 - i)
-                runner.division = division
-                member = club.get_member(runner.age, runner.name, race.date, threshold=85)
-                member.add_result(runner)
-
-
-
-def main():
-    yaml_file = "/home/joseph/race-results/2025_races.yml" 
-    ingest_location = "/home/joseph/race-results/ingest"
-    races, year, latest_race_date = load_gp_data(yaml_file)
+def race_files(race: Race, ingest_location: str):
+    """
+    Returns the (path, gender) pairs holding a race's results. Gender is only set for races
+    published as separate male and female files.
+    """
+    if race.gender_files:
+        return [(os.path.join(ingest_location, race.male_file), 'Male'),
+                (os.path.join(ingest_location, race.female_file), 'Female')]
+    return [(os.path.join(ingest_location, race.file), None)]
+
+# Modifies results in place to set membership status of each finisher. Returns (index, member name)
+# for every result credited to a member, in the order points were awarded. results can be a list or a
+# stream such as parse.iter_results; finishers are matched a batch at a time as they arrive. Memory
+# still grows with the race: ranks and points need the whole field, so every finisher with a division
+# is held until the stream ends, and callers keep the annotated results for storage and output.
+def process_gp_points(results, club: Club, race: Race, batch_size=1000):
+    match_calls_before = club.match_calls
+    ranked = []
+    count = 0
+
+    # Establish whether each result corresponds to a member. Each finisher is matched exactly once
+    # and keeps its member on the result for scoring below.
+    stream = iter(results)
+    while batch := list(islice(stream, batch_size)):
+        matches = club.match_results(batch, race.date, threshold=85)
+        for r, member in zip(batch, matches):
+            r.set_membership(member, race.date)
+
+            # A particular result can have a null division if their age or gender is not present and can't 
+            # be inferred by membership. Only results with a division need to be kept for ranking.
+            if r.gender is not None and r.age is not None:
+                ranked.append((count, r))
+            count += 1
+
+    # Divisions, ranks within division and points for the whole race in one pass
+    runners = [r for _, r in ranked]
+    divisions, points, order = score_divisions([r.gender for r in runners], [r.age for r in runners],
+                                               [r.place for r in runners], [r.is_member for r in runners])
+    for runner, division in zip(runners, divisions):
+        runner.division = division
+
+    scored = []
+    for i in order.tolist():
+        idx, runner = ranked[i]
+        if runner.is_member:
+            runner.points = int(points[i])
+            club.add_result(runner.member, runner)
+            scored.append((idx, runner.member.name))
+
+    # Save the race's new matches in one transaction
+    if club.match_cache is not None:
+        club.match_cache.commit()
+
+    race.match_calls = club.match_calls - match_calls_before
+    print(f"{race.name}: {race.match_calls} match calls for {count} finishers")
+    return scored
+
+def restore_gp_points(results: list[Result], scored, club: Club):
+    """
+    Credits a stored race's points to club members without re-matching or re-scoring it.
+    """
+    for idx, member_name in scored:
+        runner = results[idx]
+        runner.member = club.members[member_name]
+        club.add_result(runner.member, runner)
+
+
+def extract_races(pending, jobs=1, cache=False):
+    """
+    Extracts results for several races, optionally in a process pool.
+
+    Parameters:
+        pending (list): (race_index, race, files) for each race to extract, with files as
+            returned by race_files.
+        jobs (int): Number of worker processes. Each results file (including each half of a
+            male/female pair) is a separate task. 1 extracts serially in this process.
+        cache (bool): Use the parsed-results cache in parse.py.
+
+    Returns:
+        dict: race_index -> list of Results, with each race's files concatenated in order.
+    """
+    extracted = {}
+    if jobs <= 1:
+        for race_index, race, files in pending:
+            extracted[race_index] = []
+            for path, gender in files:
+                extracted[race_index] += extract_results(race, race_index, path, gender=gender, cache=cache)
+        return extracted
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {race_index: [pool.submit(extract_results, race, race_index, path, gender=gender, cache=cache)
+                                for path, gender in files]
+                   for race_index, race, files in pending}
+        for race_index, race_futures in futures.items():
+            extracted[race_index] = []
+            for future in race_futures:
+                extracted[race_index] += future.result()
+    return extracted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score the RRC Grand Prix for a season of races")
+    parser.add_argument('--races', default=DEFAULT_RACES_YAML, help="Season YAML listing the races")
+    parser.add_argument('--ingest', default=DEFAULT_INGEST_LOCATION, help="Directory holding the results files")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Reuse stored results for races whose files, entries and roster haven't changed")
+    parser.add_argument('--jobs', type=int, default=1, help="Number of processes used to extract results files")
+    parser.add_argument('--no-parse-cache', action='store_true', help="Parse every results file from scratch")
+    parser.add_argument('--clear-parse-cache', action='store_true', help="Delete all cached parses before running")
+    parser.add_argument('--offline-members', action='store_true', help="Load members from the local Airtable snapshot")
+    parser.add_argument('--full-member-sync', action='store_true', help="Download every member record from Airtable")
+    parser.add_argument('--pdf-backend', choices=['matplotlib', 'vector'], default='matplotlib',
+                        help="How the standings PDF is drawn; 'vector' is a faster multi-page layout")
+    args = parser.parse_args(argv)
+
+    if args.clear_parse_cache:
+        clear_results_cache()
+
+    races, year, latest_race_date = load_gp_data(args.races)
 
     club = Club()
-    club.load_members()
-    
-    # Print out the name and file fields
+    club.load_members(offline=args.offline_members, full=args.full_member_sync)
+    club.enable_match_cache()
+    store = RaceStore() if args.incremental else None
+
+    # Work out which races need extracting so they can all be handed to the pool at once
+    roster = scoring_fingerprint(club.members) if store is not None else None
+    plans = []
     for race_index, race in enumerate(races):
-        results = []
-        if race.gender_files:
-            male_path = os.path.join(ingest_location, race.male_file)
-            female_path = os.path.join(ingest_location, race.female_file)
-            male_results = extract_results(race, race_index, male_path, gender='Male')
-            female_results = extract_results(race, race_index, female_path, gender='Female')
-            results = male_results + female_results
-
-        elif race.file is not None:
-            file_path = os.path.join(ingest_location, race.file)
-            results = extract_results(race, race_index, file_path)
-
-        process_gp_points(results, club, race)
+        files = race_files(race, args.ingest)
+        key = None
+        stored = None
+        if store is not None:
+            key = race_key(race.entry, race_index, [path for path, _ in files], roster)
+            stored = store.get(key)
+        plans.append((race, files, key, stored))
+
+    extracted = extract_races([(race_index, race, files)
+                               for race_index, (race, files, key, stored) in enumerate(plans) if stored is None],
+                              jobs=args.jobs, cache=not args.no_parse_cache)
+
+    # Membership scoring stays serial and in race order so the results are deterministic.
+    # The match cache is closed (and its last matches saved) once every race is scored.
+    with club.match_cache:
+        for race_index, (race, files, key, stored) in enumerate(plans):
+            if stored is not None:
+                results, scored = stored
+                restore_gp_points(results, scored, club)
+                print(f"{race.name}: reused stored results")
+                continue
+
+            results = extracted.pop(race_index)
+            scored = process_gp_points(results, club, race)
+            if store is not None:
+                store.put(key, results, scored)
     
     #club.print_gp_results()
     #club.export_gp_results_to_csv(races, 'gp_results_2025.csv')
-    club.generate_gp_results_pdf(races, 'gp_results_2025.pdf')
+    club.generate_gp_results_pdf(races, 'gp_results_2025.pdf', backend=args.pdf_backend)
 
 
 
@@ -0,0 +1,135 @@
+import hashlib
+import os
+import sqlite3
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# Stored in place of a NULL age, since NULLs never collide in a primary key
+NO_AGE = -1
+
+
+def roster_fingerprint(members: dict) -> str:
+    """
+    Hashes the parts of a roster that decide which member a finisher matches: the member names
+    in roster order (order breaks ties) and their birth dates (used for the age check).
+
+    Parameters:
+        members (dict): Mapping from normalized name to Member, as in Club.members.
+
+    Returns:
+        str: Hex digest identifying the roster.
+    """
+    h = hashlib.sha256()
+    for name, member in members.items():
+        birth_date = member.birth_date.isoformat() if member.birth_date else ''
+        h.update(f"{name}\x1f{birth_date}\x1e".encode('utf-8'))
+    return h.hexdigest()
+
+
+class MatchCache:
+    """
+    On-disk cache of member matches in SQLite.
+
+    Rows are keyed by (roster fingerprint, normalized name, age, race date, threshold) and store
+    the matched member's name, or NULL when the finisher matched nobody. Rows belonging to any
+    other roster are deleted the first time a new roster is seen, so a change to the membership
+    data invalidates the whole cache.
+
+    New matches are written in one transaction that is only committed by commit() or close(),
+    so callers commit once per race rather than once per lookup. The cache can be used as a
+    context manager, which closes it on exit.
+    """
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, filename='matches.sqlite'):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, filename)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS matches (
+                roster    TEXT NOT NULL,
+                name      TEXT NOT NULL,
+                age       INTEGER NOT NULL,
+                race_date TEXT NOT NULL,
+                threshold REAL NOT NULL,
+                member    TEXT,
+                PRIMARY KEY (roster, name, age, race_date, threshold)
+            )
+        """)
+        self.conn.commit()
+        self.roster = None
+        # Rows already read by load(), per (race date, threshold), kept current by put_many
+        self._loaded = {}
+        self.hits = 0
+        self.misses = 0
+
+    def set_roster(self, fingerprint: str):
+        """
+        Switches to a roster, dropping every cached match made against a different one.
+        """
+        if fingerprint == self.roster:
+            return
+        self.conn.execute("DELETE FROM matches WHERE roster != ?", (fingerprint,))
+        self.conn.commit()
+        self.roster = fingerprint
+        self._loaded = {}
+
+    def load(self, race_date, threshold) -> dict:
+        """
+        Returns all cached matches for a race as {(normalized name, age): member name or None}.
+        The rows are read from disk once per race; later calls return the same dict, updated
+        with any matches stored since. Callers must not modify it.
+        """
+        key = (race_date.isoformat(), threshold)
+        loaded = self._loaded.get(key)
+        if loaded is None:
+            rows = self.conn.execute(
+                "SELECT name, age, member FROM matches WHERE roster = ? AND race_date = ? AND threshold = ?",
+                (self.roster, key[0], threshold))
+            loaded = {(name, None if age == NO_AGE else age): member for name, age, member in rows}
+            self._loaded[key] = loaded
+        return loaded
+
+    def get(self, name, age, race_date, threshold):
+        """
+        Returns (True, member name or None) on a hit and (False, None) on a miss.
+        """
+        row = self.conn.execute(
+            "SELECT member FROM matches WHERE roster = ? AND name = ? AND age = ? AND race_date = ? AND threshold = ?",
+            (self.roster, name, NO_AGE if age is None else age, race_date.isoformat(), threshold)).fetchone()
+        if row is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, row[0]
+
+    def put_many(self, entries, race_date, threshold):
+        """
+        Stores matches given as an iterable of (normalized name, age, member name or None).
+        They are visible to this connection at once but only saved on commit().
+        """
+        entries = list(entries)
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?)",
+            [(self.roster, name, NO_AGE if age is None else age, race_date.isoformat(), threshold, member)
+             for name, age, member in entries])
+        loaded = self._loaded.get((race_date.isoformat(), threshold))
+        if loaded is not None:
+            for name, age, member in entries:
+                loaded[(name, age)] = member
+
+    def commit(self):
+        self.conn.commit()
+
+    def clear(self):
+        self._loaded = {}
+        self.conn.execute("DELETE FROM matches")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
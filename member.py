@@ -1,29 +1,33 @@
 import csv
 import re
 import os
+import time
 from datetime import datetime, date
-from difflib import SequenceMatcher
-from rapidfuzz import fuzz
+from functools import lru_cache
+from rapidfuzz import fuzz, process
 import unicodedata
-from fuzzyname import Name
-import dateparser
 from parse import Result
-from dateutil.relativedelta import relativedelta
+from name_index import NameIndex, sorted_tokens
+from match_cache import MatchCache, roster_fingerprint, DEFAULT_CACHE_DIR
+from dates import parse_date, print_date_parse_stats, date_key, age_between
+from airtable_sync import sync_airtable_snapshot, AIRTABLE_URL
+from standings import Standings
 import math
-import requests
-from dotenv import load_dotenv
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.colors import ListedColormap
-import numpy as np
-from datetime import datetime
 
-from nicknames import NickNamer, default_lookup
+# Heavy dependencies (matplotlib, numpy, requests, dotenv, nicknames) are imported in
+# the functions that use them, so importing this module stays cheap
 
-lookup = default_lookup()
-lookup["linda"].add("lin")
-lookup["belinda"].add("lin")
-nick_namer = NickNamer(nickname_lookup=lookup)
+@lru_cache(maxsize=None)
+def get_nick_namer():
+    """
+    Builds the nickname lookup on first use, with a few local additions.
+    """
+    from nicknames import NickNamer, default_lookup
+
+    lookup = default_lookup()
+    lookup["linda"].add("lin")
+    lookup["belinda"].add("lin")
+    return NickNamer(nickname_lookup=lookup)
 
 def process_race_name(name, max_width=15):
    words = name.split()
@@ -52,16 +56,23 @@ def process_race_name(name, max_width=15):
 
    return '\n'.join(lines)
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+
+@lru_cache(maxsize=65536)
 def normalize_name(name: str) -> str:
     """
     Normalize name by:
       - lowercasing
       - removing accents and punctuation
       - expanding nicknames using nicknames package
+
+    Results are memoized, since the same finisher names come up race after race.
     """
     name = name.lower().strip()
-    name = unicodedata.normalize('NFKD', name)
-    name = re.sub(r'[^\w\s]', '', name)
+    if not name.isascii():
+        name = unicodedata.normalize('NFKD', name)
+    name = _PUNCTUATION_RE.sub('', name)
     parts = name.split()
     if parts:
         first = parts[0][:4]
@@ -69,7 +80,7 @@ def normalize_name(name: str) -> str:
 
 
         # Arbitrary, but for consistency, take all possible canonicals and nicknames of a name and take first one
-        #versions = nick_namer.canonicals_of(first) | nick_namer.nicknames_of(first)
+        #versions = get_nick_namer().canonicals_of(first) | get_nick_namer().nicknames_of(first)
         #versions.add(first)
 
         #first = (sorted(versions)[0] if versions else first)
@@ -77,6 +88,9 @@ def normalize_name(name: str) -> str:
     return " ".join(parts)
 
 
+# Row colors for the top three places in the standings PDF
+MEDAL_COLORS = {1: '#FFD700', 2: '#C0C0C0', 3: '#CD7F32'}
+
 female_markers = ['f', 'female']
 male_markers = ['m', 'male']
 nonbinary_markers = ['n', 'nonbinary', 'nb', 'non-binary']
@@ -117,6 +131,11 @@ class Member:
     """
     Represents a club member with relevant membership details.
     """
+    # Bumped whenever any member's birth date is set, so cached ages know to recompute
+    birth_date_version = 0
+    # Bumped whenever any member's results or division change, so cached standings know to recompute
+    standings_version = 0
+
     def __init__(self, submission_date_str, first_name, last_name, birth_date,
                  gender, products_str, email=None, address=None, phone=None, 
                  start_year=None, end_year=None):
@@ -127,6 +146,8 @@ class Member:
         self.first_name = first_name
         self.last_name = last_name
         self.name = normalize_name(f'{first_name} {last_name}'.rstrip('-'))
+        # Precomputed token_sort_ratio form used by matching
+        self.sorted_name = sorted_tokens(self.name)
         self.birth_date = birth_date
 
         self.email = email
@@ -169,6 +190,33 @@ class Member:
         self.set_active_status()
 
 
+    @property
+    def birth_date(self):
+        return self._birth_date
+
+    @birth_date.setter
+    def birth_date(self, value):
+        self._birth_date = value
+        # Integer (year, month, day, time of day) form used for age arithmetic
+        self.birth_key = date_key(value)
+        Member.birth_date_version += 1
+
+    @property
+    def division(self):
+        return self._division
+
+    @division.setter
+    def division(self, value):
+        self._division = value
+        Member.standings_version += 1
+
+    def age_on(self, race_date):
+        """
+        Returns the member's age in whole years on race_date, the same as
+        relativedelta(race_date, birth_date).years. Members without a birth date are 0.
+        """
+        return age_between(date_key(race_date), self.birth_key)
+
     def set_active_status(self):
         year = datetime.now().year
         if self.start_year <= year <= self.end_year:
@@ -178,6 +226,7 @@ class Member:
 
     def add_result(self, result: Result):
         self.results.append(result)
+        Member.standings_version += 1
 
     def display(self):
         """
@@ -193,7 +242,7 @@ class Member:
 
     def set_division(self):
         # Division spans a decade except for <19
-        age = relativedelta(date.today(), self.birth_date).years
+        age = self.age_on(date.today())
         if 'unkin' in self.last_name:
             print('aaaaa')
             print(self.gender)
@@ -216,84 +265,204 @@ class Club:
     """
     def __init__(self):
         self.members = {}
+        self._name_index = None
+        self._name_index_source = None
+        self._roster_fingerprint = None
+        self._roster_version = None
+        # Ages of the members in name index order, per race date key
+        self._ages_by_race = {}
+        # Standings per race count, dropped whenever Member.standings_version moves on
+        self._standings = {}
+        self._standings_version = None
+        # Number of finishers matched against the roster, via get_member or match_results
+        self.match_calls = 0
+        self.match_cache = None
+
+    def _get_name_index(self):
+        """
+        Returns the name index over self.members, rebuilding it if members were added or the dict was swapped out.
+        The roster fingerprint and cached ages are refreshed whenever the index or any birth date changes.
+        """
+        index = self._name_index
+        if index is None or self._name_index_source is not self.members or len(index) != len(self.members):
+            index = NameIndex(self.members.keys(), [member.sorted_name for member in self.members.values()])
+            self._name_index = index
+            self._name_index_source = self.members
+        version = (index, Member.birth_date_version)
+        if self._roster_version != version:
+            self._roster_fingerprint = roster_fingerprint(self.members)
+            self._ages_by_race = {}
+            self._roster_version = version
+        return index
+
+    def member_ages(self, race_date):
+        """
+        Returns every member's age on race_date as a list in name index (roster) order.
+        Computed once per race date with integer arithmetic and reused until the roster changes.
+        """
+        index = self._get_name_index()
+        race_key = date_key(race_date)
+        ages = self._ages_by_race.get(race_key)
+        if ages is None:
+            members = self.members
+            ages = [age_between(race_key, members[name].birth_key) for name in index.names]
+            self._ages_by_race[race_key] = ages
+        return ages
+
+    def roster_fingerprint(self):
+        """
+        Returns a digest of the member names and birth dates that matching depends on.
+        """
+        self._get_name_index()
+        return self._roster_fingerprint
+
+    def enable_match_cache(self, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Persists get_member and match_results lookups in an SQLite cache under cache_dir.
+        Cached matches are dropped automatically whenever the member roster changes.
+        """
+        self.match_cache = MatchCache(cache_dir)
 
+    def _get_match_cache(self):
+        # Make sure the cache is looking at rows for the current roster
+        if self.match_cache is not None:
+            self._get_name_index()
+            self.match_cache.set_roster(self._roster_fingerprint)
+        return self.match_cache
 
     def merge_members(self, other_members, threshold=85):
         """
         Merges members from another dict into self.members using fuzzy name matching.
         Updates missing gender and birth_date fields where applicable.
 
+        Each incoming member is merged into the existing member whose name scores highest with
+        token_sort_ratio (ties go to the earliest in self.members), or added as a new member
+        if nothing reaches the threshold. Records are handled in order, so a later record can
+        match one added earlier in the same merge.
+
+        Candidate pairs are blocked with NameIndex, both against the current roster and against
+        earlier incoming records, and scored in one vectorized cpdist call.
+
         Parameters:
             other_members (dict): Mapping from raw name to Member object.
             threshold (int): Similarity threshold (0–100) for considering two names the same.
-        """
-        unmatched = []
 
-        for other in other_members.values():
-            if not other.name:
-                continue
+        Returns:
+            dict: Merge report with the counts of matched, added and skipped records, the
+            names of the incoming records that matched nobody and were added as new members
+            with a membership that is still current ('unmatched'), the number of pairs scored
+            and the time taken.
+        """
+        started = time.perf_counter()
+        incoming = [other for other in other_members.values() if other.name]
+        names = [other.name for other in incoming]
+        existing = list(self.members)
+
+        # Block: only pairs that could reach the threshold are scored
+        existing_index = NameIndex(existing, [self.members[name].sorted_name for name in existing])
+        incoming_index = NameIndex(names, [other.sorted_name for other in incoming])
+        pair_rows, pair_names, pair_targets = [], [], []
+        for i, name in enumerate(names):
+            for j in existing_index.candidates(name, threshold):
+                pair_rows.append(i)
+                pair_names.append(existing[j])
+                pair_targets.append(None)
+            for j in incoming_index.candidates(name, threshold):
+                if j >= i:
+                    break
+                pair_rows.append(i)
+                pair_names.append(names[j])
+                pair_targets.append(j)
+
+        scores = []
+        if pair_rows:
+            scores = process.cpdist([names[i] for i in pair_rows], pair_names, scorer=fuzz.token_sort_ratio,
+                                    score_cutoff=threshold, workers=-1).tolist()
+
+        # Group the passing scores by incoming record, keeping roster order within each group
+        passing = [[] for _ in incoming]
+        for i, name, target, score in zip(pair_rows, pair_names, pair_targets, scores):
+            if score >= threshold:
+                passing[i].append((name, target, score))
 
+        matched = 0
+        added = set()
+        unmatched = []
+        for i, other in enumerate(incoming):
+            # Existing members come before earlier incoming records in both lists, as in self.members
             best_match_key = None
             best_score = 0
-
-            # Try to find a close-enough match in current members
-            for memb_name in self.members:
-                score = fuzz.token_sort_ratio(other.name, memb_name)
-                # TODO: keep playing around with this line case-by-case and knock out edge cases
-                # There is definitely going to have to be some manual intervention. e.g. lin is not
-                # registered as a nickname of Linda, but she's in as Linda on the base csv
-                niq = 'abdullahi'
-                if score > best_score and score >= threshold:
+            for name, target, score in passing[i]:
+                # Earlier incoming records only count if they were added as new members
+                if target is not None and target not in added:
+                    continue
+                if score > best_score:
                     best_score = score
-                    best_match_key = memb_name
-
-                if best_match_key:
-                    match = self.members[best_match_key]
-
-                    # Fill in missing info if possible
-                    if not match.gender and other.gender:
-                        match.gender = other.gender
-                    if not match.birth_date and other.birth_date:
-                        match.birth_date = other.birth_date
-                        match.set_division()
-
-                    match.email = other.email
-                    match.address = other.address
-                    match.phone = other.phone
+                    best_match_key = name
+
+            # TODO: keep playing around with this case-by-case and knock out edge cases
+            # There is definitely going to have to be some manual intervention. e.g. lin is not
+            # registered as a nickname of Linda, but she's in as Linda on the base csv
+            if best_match_key:
+                self._merge_member(self.members[best_match_key], other)
+                matched += 1
+            else:
+                # Add as new member; report it only if membership is still current
+                if other.end_year >= date.today().year:
+                    unmatched.append(other.name)
+                self.members[other.name] = other
+                added.add(i)
 
+        if unmatched:
+            print(f'Unmatched: {unmatched}')
 
-                    # Handle products field
-                    if other.products and len(other.products.strip()) > 0:
-                        match.products = other.products
-                    elif not match.products:
-                        # Reverse engineer products if both match and other don't have it
-                        submission_year = other.submission_date.year
-                        end_year = match.end_year
+        report = {
+            'records': len(other_members),
+            'matched': matched,
+            'added': len(added),
+            'skipped': len(other_members) - len(incoming),
+            'unmatched': unmatched,
+            'pairs_scored': len(pair_rows),
+            'seconds': time.perf_counter() - started,
+        }
+        print(f"Merged {report['records']} records in {report['seconds']:.3f}s: {matched} matched, "
+              f"{report['added']} added ({len(unmatched)} current), {report['skipped']} without a name, "
+              f"{report['pairs_scored']} of {len(incoming) * len(existing) + len(incoming) * (len(incoming) - 1) // 2} pairs scored")
+        return report
 
-                        products_parts = ["1 Year"]
+    def _merge_member(self, match, other):
+        """
+        Copies what another record knows about a member onto the matched member.
+        """
+        # Fill in missing info if possible
+        if not match.gender and other.gender:
+            match.gender = other.gender
+        if not match.birth_date and other.birth_date:
+            match.birth_date = other.birth_date
+            match.set_division()
 
-                        if end_year != submission_year:
-                            year_difference = end_year - submission_year
-                            if year_difference > 0:
-                                products_parts.append(f"Special Quantity: {year_difference}")
+        match.email = other.email
+        match.address = other.address
+        match.phone = other.phone
 
-                        match.products = ", ".join(products_parts)
+        # Handle products field
+        if other.products and len(other.products.strip()) > 0:
+            match.products = other.products
+        elif not match.products:
+            # Reverse engineer products if both match and other don't have it
+            submission_year = other.submission_date.year
+            end_year = match.end_year
 
-                    match.submission_date = other.submission_date
-                    break
+            products_parts = ["1 Year"]
 
+            if end_year != submission_year:
+                year_difference = end_year - submission_year
+                if year_difference > 0:
+                    products_parts.append(f"Special Quantity: {year_difference}")
 
-            else:
-                # Add as new member only if membership is still current
-                if other.end_year >= date.today().year:
-                    unmatched.append(other.name)
-                self.members[other.name] = other
-                if 'feda' in other.name.lower():
-                    print('qqqqq')
-                    print(other.products)
+            match.products = ", ".join(products_parts)
 
-        if unmatched:
-            print(f'Unmatched: {unmatched}')
+        match.submission_date = other.submission_date
 
     def load_base_csv(self, filepath):
         """
@@ -307,10 +476,10 @@ class Club:
                 raw_first = row['First name']
                 raw_last = row['Last name']
                 expires = row['Expires']
-                birthdate = dateparser.parse(row.get('Birthdate', ''))
+                birthdate = parse_date(row.get('Birthdate', ''))
 
                 # Determine end year from Expires date
-                exp_date = dateparser.parse(expires)
+                exp_date = parse_date(expires)
                 if exp_date is not None:
                     end_year = exp_date.year
                 else:
@@ -338,6 +507,8 @@ class Club:
                     )
                     self.members[m.name] = m
 
+        print_date_parse_stats()
+
     def load_from_csv(self, filepath, family=False, only_active=True):
         """
         Reads a CSV file (individual or family format), parses relevant columns,
@@ -395,7 +566,7 @@ class Club:
                     submission_date_str=submission_date_str,
                     first_name=first_name,
                     last_name=last_name,
-                    birth_date=dateparser.parse(row['Birth Date']),
+                    birth_date=parse_date(row['Birth Date']),
                     gender=row['Gender'],
                     products_str=base_products,
                     email=email,
@@ -454,6 +625,8 @@ class Club:
                                         if m.birth_date is None:
                                             m.birth_date = loaded_members[m.name].birth_date
                                     loaded_members[m.name] = m
+
+        print_date_parse_stats()
         return loaded_members
 
 
@@ -546,7 +719,7 @@ class Club:
         else:
             dob = '/'.join([month, day, year])
             # Normalize DOB to 'Month DD YYYY'
-            dob_date = dateparser.parse(dob)
+            dob_date = parse_date(dob)
         return first_name, last_name, dob_date, gender
 
     def display_all(self):
@@ -576,122 +749,188 @@ class Club:
         if race_date is None:
             race_date = date.today()
 
-        for norm_name, member in self.members.items():
+        cache = self._get_match_cache()
+        if cache is not None:
+            hit, member_name = cache.get(norm_input, age, race_date, threshold)
+            if hit:
+                return None if member_name is None else self.members[member_name]
+
+        self.match_calls += 1
+
+        index = self._get_name_index()
+        best_name = None
+
+        member_ages = self.member_ages(race_date) if age is not None else None
+
+        # Names with the same sorted tokens score 100, which nothing can beat, so the first of
+        # them that passes the age check is the answer without scoring anything else
+        if norm_input:
+            for idx in index.exact_matches(norm_input):
+                if age is None or abs(member_ages[idx] - age) <= 1:
+                    best_name = index.names[idx]
+                    best_match = self.members[best_name]
+                    break
+
+        # Only score the names that can possibly reach the threshold. Candidates come back in
+        # member order so ties resolve exactly as a full scan would.
+        for idx in ([] if best_name is not None else index.candidates(norm_input, threshold)):
+            norm_name = index.names[idx]
+            member = self.members[norm_name]
             score = fuzz.token_sort_ratio(norm_input, norm_name)
             if score >= threshold:
                 # Skip age check if age is None
-                if age is not None:
-                    member_age = relativedelta(race_date, member.birth_date).years
-                    if abs(member_age - age) > 1:
-                        continue
+                if age is not None and abs(member_ages[idx] - age) > 1:
+                    continue
 
                 # Update best match if this score is higher
                 if score > best_score:
                     best_score = score
                     best_match = member
+                    best_name = norm_name
+
+        if cache is not None:
+            cache.put_many([(norm_input, age, best_name)], race_date, threshold)
 
         return best_match
 
 
 
-    def load_members(self):
-        load_dotenv()
-        base_id = os.getenv('AIRTABLE_BASE_ID')
-        self.load_members_from_airtable(base_id, "Table 1", "Active Members")
-
-    def print_gp_results(self):
+    def match_results(self, results, race_date=None, threshold=85, chunk_size=1024, workers=-1):
         """
-        Print Grand Prix results organized by age/gender divisions.
+        Batch version of get_member for every finisher of a race.
+
+        All finisher names are normalized once and scored against every member name in a single
+        rapidfuzz score matrix. The +/-1 year age check is applied as a mask over the matrix.
+
+        Parameters:
+            results (list[Result]): Finishers to match.
+            race_date (date): date of the race. If None, will use current date.
+            threshold (float): Fuzzy match threshold between 0 and 100.
+            chunk_size (int): Number of finishers scored per matrix, to bound memory.
+            workers (int): Threads used by rapidfuzz. -1 uses all cores.
+
+        Returns:
+            list[Member]: Best matching member for each result (same as get_member), or None.
         """
-        # Create divisions dictionary to group members
-        divisions = {}
+        import numpy as np
 
-        for member_name in self.members.keys():
-            member = self.members[member_name]
-            if hasattr(member, 'results') and member.results:
+        if race_date is None:
+            race_date = date.today()
 
-                if member.division is None:
-                    continue
+        matches = [None] * len(results)
+        if not results or not self.members:
+            self.match_calls += len(results)
+            return matches
+
+        queries = [normalize_name(r.name) for r in results]
+        ages = [r.age for r in results]
+
+        # Serve what we can from the on-disk cache and only score the rest
+        cache = self._get_match_cache()
+        pending = list(range(len(results)))
+        if cache is not None:
+            cached = cache.load(race_date, threshold)
+            pending = []
+            for i, key in enumerate(zip(queries, ages)):
+                if key in cached:
+                    member_name = cached[key]
+                    matches[i] = None if member_name is None else self.members[member_name]
+                else:
+                    pending.append(i)
+            cache.hits += len(results) - len(pending)
+            cache.misses += len(pending)
 
-                # Calculate total points for this member (top 5 results only)
-                total_points = sum(result.points for result in sorted(member.results, key=lambda r: r.points, reverse=True)[:5])
+        self.match_calls += len(pending)
+        if not pending:
+            return matches
 
+        member_ages = np.array(self.member_ages(race_date))
+        member_names = self._get_name_index().names
+        member_list = [self.members[name] for name in member_names]
+        matched_names = {}
 
-                division_key = member.division 
+        for start in range(0, len(pending), chunk_size):
+            rows = pending[start:start + chunk_size]
+            scores = process.cdist([queries[i] for i in rows], member_names, scorer=fuzz.token_sort_ratio,
+                                   score_cutoff=threshold, dtype=np.float64, workers=workers)
 
-                if division_key not in divisions:
-                    divisions[division_key] = []
+            # Rows for finishers without an age skip the age check, as in get_member
+            row_ages = np.array([-1 if ages[i] is None else ages[i] for i in rows])
+            has_age = np.array([ages[i] is not None for i in rows])
+            age_ok = ~has_age[:, None] | (np.abs(member_ages[None, :] - row_ages[:, None]) <= 1)
 
-                divisions[division_key].append({
-                    'name': f"{member.first_name} {member.last_name}",
-                    'points': total_points,
-                    'race_count': len(member.results)
-                })
-                if len(member.results) > 1:
-                    print(member.results[0].time, member.results[1].time)
+            masked = np.where((scores >= threshold) & age_ok, scores, -1)
+            # argmax keeps the first of equal scores, which matches the member order tie-break
+            best = masked.argmax(axis=1)
+            for k, col in enumerate(best):
+                if masked[k, col] >= 0:
+                    matches[rows[k]] = member_list[col]
+                    matched_names[rows[k]] = member_names[col]
+
+        if cache is not None:
+            cache.put_many([(queries[i], ages[i], matched_names.get(i)) for i in pending], race_date, threshold)
+
+        return matches
+
+    def load_members(self, offline=False, full=False):
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        base_id = os.getenv('AIRTABLE_BASE_ID')
+        self.load_members_from_airtable(base_id, "Table 1", "Active Members", offline=offline, full=full)
+
+    def add_result(self, member, result: Result):
+        """
+        Credits a scored result to a member.
+        """
+        member.add_result(result)
 
+    def standings(self, races=None):
+        """
+        Returns the Grand Prix standings, computed once and reused until any member's results
+        or division change.
+
+        Parameters:
+            races (list): Races of the season; their count sets the length of each member's
+                per-race points. None sizes it to the races that have results.
+        """
+        if self._standings_version != Member.standings_version:
+            self._standings = {}
+            self._standings_version = Member.standings_version
+        race_count = None if races is None else len(races)
+        standings = self._standings.get(race_count)
+        if standings is None:
+            standings = Standings(self.members, race_count)
+            self._standings[race_count] = standings
+        return standings
+
+    def print_gp_results(self):
+        """
+        Print Grand Prix results organized by age/gender divisions.
+        """
+        standings = self.standings()
 
-        for division in sorted(divisions.keys()):
+        for entry in standings.entries:
+            results = entry['member'].results
+            if len(results) > 1:
+                print(results[0].time, results[1].time)
+
+        for division in sorted(standings.divisions.keys()):
             print(f"\n=== {division} Division ===")
             print("-" * 50)
 
             # Sort by points (descending), then by race count (descending) as tiebreaker
-            sorted_members = sorted(divisions[division], 
-                                  key=lambda x: (-x['points'], -x['race_count']))
+            sorted_members = sorted(standings.divisions[division],
+                                  key=lambda x: (-x['total_best_5'], -x['total_races']))
 
             print(f"{'Rank':<4} {'Name':<25} {'Points':<8} {'Races':<6}")
             print("-" * 50)
 
             for i, member in enumerate(sorted_members, 1):
-                print(f"{i:<4} {member['name']:<25} {member['points']:<8} {member['race_count']:<6}")
+                print(f"{i:<4} {member['name']:<25} {member['total_best_5']:<8} {member['total_races']:<6}")
 
         print("\n" + "="*60)
 
-    def _process_division_data(self, races):
-        divisions = {}
-        for member_name in self.members.keys():
-            member = self.members[member_name]
-            if hasattr(member, 'results') and member.results:
-                if member.division is None:
-                    continue
-
-                # Calculate member statistics
-                total_points = sum(result.points for result in member.results)
-                total_races = len(member.results)
-                total_best_5 = sum(result.points for result in sorted(member.results, key=lambda r: r.points, reverse=True)[:5])
-
-                # Create race results array ordered by race_index
-                race_results = [''] * len(races)  # Initialize with empty strings
-                for result in member.results:
-                    if result.race_index is not None and result.race_index < len(race_results):
-                        race_results[result.race_index] = result.points
-
-                # Group by division
-                if member.division not in divisions:
-                    divisions[member.division] = []
-
-                divisions[member.division].append({
-                    'name': f"{member.first_name} {member.last_name}",
-                    'race_results': race_results,
-                    'total_points': total_points,
-                    'total_races': total_races,
-                    'total_best_5': total_best_5
-                })
-
-        # Sort members within each division and assign places
-        for division in divisions:
-            # Sort by total_best_5 descending (highest to lowest)
-            divisions[division].sort(key=lambda x: x['total_best_5'], reverse=True)
-
-            # Assign places with ties allowed
-            current_place = 1
-            for i, member_data in enumerate(divisions[division]):
-                if i > 0 and divisions[division][i-1]['total_best_5'] != member_data['total_best_5']:
-                    current_place = i + 1
-                member_data['place'] = current_place
-
-        return divisions
-
     def export_gp_results_to_csv(self, races, filename):
         """
         Export Grand Prix results to CSV format with race columns and division sections.
@@ -700,8 +939,7 @@ class Club:
             races: List of Race objects (for column headers and ordering)
             filename: Output CSV filename
         """
-        # Create divisions dictionary to group members
-        divisions = self._process_division_data(races)
+        divisions = self._prepare_division_data(races)
 
 
         # Write to CSV file
@@ -794,10 +1032,74 @@ class Club:
 
             print(f"Successfully wrote {len(self.members)} members to {filepath}")
 
-    def generate_gp_results_pdf(self, races, filename):
+    def generate_gp_results_pdf(self, races, filename, backend='matplotlib'):
+        """
+        Writes the Grand Prix standings to a PDF with one table per division.
+
+        Parameters:
+            races (list): Races of the season, in order.
+            filename (str): PDF file to write.
+            backend (str): 'matplotlib' (the default) draws every division as a matplotlib
+                table on one tall figure. 'vector' is a much faster alternative that writes the
+                tables straight to PDF text and lines, flowing them over as many pages as needed.
+        """
+        if backend == 'vector':
+            self._generate_gp_results_pdf_vector(races, filename)
+        elif backend == 'matplotlib':
+            self._generate_gp_results_pdf_matplotlib(races, filename)
+        else:
+            raise ValueError(f"Unknown PDF backend: {backend}")
+
+    def _standings_table(self, members, races):
+        """
+        Returns the header row and member rows of a division's standings table, as text.
+        """
+        # Header row
+        header_row = ['Name']
+        for race in races:
+            race_name = process_race_name(getattr(race, 'name', 'Race'))
+            header_row.append(race_name)
+        header_row.extend(['Points', 'Races', 'Best 5', 'Place'])
+
+        # Member rows
+        rows = []
+        for member_data in members:
+            row = [member_data['name']]
+            row.extend([str(points) if points != '' else '' for points in member_data['race_results']])
+            row.extend([
+                str(member_data['total_points']),
+                str(member_data['total_races']),
+                str(member_data['total_best_5']),
+                str(member_data['place'])
+            ])
+            rows.append(row)
+        return header_row, rows
+
+    def _generate_gp_results_pdf_vector(self, races, filename):
+        from pdf_tables import write_tables_pdf
+
+        divisions = self._prepare_division_data(races)
+        tables = []
+        for division_name in sorted(divisions.keys()):
+            members = divisions[division_name]
+            header_row, rows = self._standings_table(members, races)
+            tables.append({
+                'title': self._format_division_name(division_name),
+                'header': header_row,
+                'rows': rows,
+                'fills': [MEDAL_COLORS.get(member_data['place']) for member_data in members],
+            })
+
+        current_year = datetime.now().year
+        write_tables_pdf(filename, f'RRC Grand Prix {current_year}', tables,
+                         rotated_columns=range(1, len(races) + 1))
+
+    def _generate_gp_results_pdf_matplotlib(self, races, filename):
         """
         Enhanced version with better handling of multiple divisions and improved layout
         """
+        import matplotlib.pyplot as plt
+
         # Prepare data (same as above)
         divisions = self._prepare_division_data(races)
 
@@ -850,7 +1152,7 @@ class Club:
         plt.subplots_adjust(top=0.93)  # Brings subplots closer to title
 
         # Medal colors
-        medal_colors = {1: '#FFD700', 2: '#C0C0C0', 3: '#CD7F32'}
+        medal_colors = MEDAL_COLORS
 
         # Define consistent row heights for uniform appearance
         header_height_units = 10
@@ -867,28 +1169,12 @@ class Club:
             clean_division_name = self._format_division_name(division_name)
 
             # Prepare table data
-            table_data = []
-            cell_colors = []
-
-            # Header row
-            header_row = ['Name']
-            for race in races:
-                race_name = process_race_name(getattr(race, 'name', 'Race'))
-                header_row.append(race_name)
-            header_row.extend(['Points', 'Races', 'Best 5', 'Place'])
-            table_data.append(header_row)
-            cell_colors.append(['white'] * len(header_row))
+            header_row, rows = self._standings_table(members, races)
+            table_data = [header_row]
+            cell_colors = [['white'] * len(header_row)]
 
             # Member rows
-            for member_data in members:
-                row = [member_data['name']]
-                row.extend([str(points) if points != '' else '' for points in member_data['race_results']])
-                row.extend([
-                    str(member_data['total_points']),
-                    str(member_data['total_races']),
-                    str(member_data['total_best_5']),
-                    str(member_data['place'])
-                ])
+            for member_data, row in zip(members, rows):
                 table_data.append(row)
 
                 # Apply medal colors
@@ -964,143 +1250,86 @@ class Club:
 
     def _prepare_division_data(self, races):
         """
-        Helper method to prepare and sort division data
+        Returns the standings entries grouped by division, sorted and placed within each.
         """
-        divisions = {}
-
-        for member_name in self.members.keys():
-            member = self.members[member_name]
-            if hasattr(member, 'results') and member.results:
-                if member.division is None:
-                    continue
-
-                # Calculate statistics
-                total_points = sum(result.points for result in member.results)
-                total_races = len(member.results)
-                total_best_5 = sum(result.points for result in sorted(member.results, key=lambda r: r.points, reverse=True)[:5])
-
-                # Race results array
-                race_results = [''] * len(races)
-                for result in member.results:
-                    if result.race_index is not None and result.race_index < len(race_results):
-                        race_results[result.race_index] = result.points
-
-                if member.division not in divisions:
-                    divisions[member.division] = []
-
-                divisions[member.division].append({
-                    'name': f"{member.first_name} {member.last_name}",
-                    'race_results': race_results,
-                    'total_points': total_points,
-                    'total_races': total_races,
-                    'total_best_5': total_best_5
-                })
-
-        # Sort and assign places
-        for division in divisions:
-            divisions[division].sort(key=lambda x: x['total_best_5'], reverse=True)
-            current_place = 1
-            for i, member_data in enumerate(divisions[division]):
-                if i > 0 and divisions[division][i-1]['total_best_5'] != member_data['total_best_5']:
-                    current_place = i + 1
-                member_data['place'] = current_place
-
-        return divisions
-
-
+        return self.standings(races).divisions
 
-
-    def load_members_from_airtable(self, base_id, table_name, view_name):
+    def load_members_from_airtable(self, base_id, table_name, view_name, offline=False, full=False,
+                                   cache_dir=DEFAULT_CACHE_DIR, base_url=AIRTABLE_URL, session=None):
         """
         Loads members from an Airtable view, equivalent to load_members but using Airtable API.
         Personal Access Token is loaded from .env file.
 
+        Records are kept in a local snapshot (see airtable_sync), so after the first run only
+        records modified since the last sync are fetched, plus a list of the IDs still in the
+        view. Members are added in the view's order.
+
         Parameters:
             base_id (str): Airtable base ID
             table_name (str): Name of the table in Airtable
             view_name (str): Name of the view to fetch from
+            offline (bool): Load from the snapshot without contacting Airtable
+            full (bool): Download the whole view again instead of only changed records
+            cache_dir (str): Directory holding the snapshot
+            base_url (str): Airtable API root, replaceable with a stub server
+            session (requests.Session): Session to reuse for the requests
         """
-        # Load environment variables from .env file
-        load_dotenv()
-        access_token = os.getenv('AIRTABLE_ACCESS_TOKEN')
-
-        if not access_token:
-            raise ValueError("AIRTABLE_ACCESS_TOKEN not found in .env file")
+        access_token = None
+        if not offline:
+            from dotenv import load_dotenv
 
-        url = f"https://api.airtable.com/v0/{base_id}/{table_name}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        params = {
-            "view": view_name,
-            "maxRecords": 1000  # Adjust as needed
-        }
-
-        all_records = []
-        offset = None
-
-        # Handle pagination
-        while True:
-            if offset:
-                params["offset"] = offset
-
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
+            # Load environment variables from .env file
+            load_dotenv()
+            access_token = os.getenv('AIRTABLE_ACCESS_TOKEN')
 
-            data = response.json()
-            all_records.extend(data.get("records", []))
+            if not access_token:
+                raise ValueError("AIRTABLE_ACCESS_TOKEN not found in .env file")
 
-            offset = data.get("offset")
-            if not offset:
-                break
+        snapshot = sync_airtable_snapshot(base_id, table_name, view_name, access_token, offline=offline,
+                                          full=full, cache_dir=cache_dir, base_url=base_url, session=session)
 
         # Process records and create Member objects
-        for record in all_records:
-            fields = record.get("fields", {})
-
-            # Parse dates
-            birth_date = None
-            if fields.get("Birthday"):
-                try:
-                    birth_date = datetime.strptime(fields["Birthday"], "%Y-%m-%d").date()
-                except ValueError:
-                    pass
-
-            submission_date = None
-            if fields.get("Submission Date"):
-                try:
-                    submission_date = datetime.strptime(fields["Submission Date"], "%Y-%m-%d")
-                except ValueError:
-                    pass
-
-            # Parse expiration date for start/end years
-            end_year = date.today().year
-            if fields.get("Membership Expiration Date"):
-                try:
-                    exp_date = datetime.strptime(fields["Membership Expiration Date"], "%Y-%m-%d").date()
-                    end_year = exp_date.year
-                except ValueError:
-                    pass
-
-            # Create Member object
-            member = Member(
-                submission_date_str=fields.get("Submission Date", ""),
-                first_name=fields.get("First Name", ""),
-                last_name=fields.get("Last Name", ""),
-                birth_date=birth_date,
-                gender=fields.get("Gender", ""),
-                products_str=fields.get("Products", ""),
-                start_year=date.today().year,
-                end_year=end_year,
-                email=fields.get("Email", ""),
-                address=fields.get("Mailing Address", ""),
-                phone=fields.get("Phone", "")
-            )
-
+        for record in snapshot.ordered_records():
+            member = self._member_from_airtable_record(record)
             if member.name:  # Only add if name exists
                 self.members[member.name] = member
 
+    def _member_from_airtable_record(self, record):
+        """
+        Builds a Member from a raw Airtable record.
+        """
+        fields = record.get("fields", {})
+
+        # Parse dates
+        birth_date = None
+        if fields.get("Birthday"):
+            try:
+                birth_date = datetime.strptime(fields["Birthday"], "%Y-%m-%d").date()
+            except ValueError:
+                pass
+
+        # Parse expiration date for start/end years
+        end_year = date.today().year
+        if fields.get("Membership Expiration Date"):
+            try:
+                exp_date = datetime.strptime(fields["Membership Expiration Date"], "%Y-%m-%d").date()
+                end_year = exp_date.year
+            except ValueError:
+                pass
+
+        return Member(
+            submission_date_str=fields.get("Submission Date", ""),
+            first_name=fields.get("First Name", ""),
+            last_name=fields.get("Last Name", ""),
+            birth_date=birth_date,
+            gender=fields.get("Gender", ""),
+            products_str=fields.get("Products", ""),
+            start_year=date.today().year,
+            end_year=end_year,
+            email=fields.get("Email", ""),
+            address=fields.get("Mailing Address", ""),
+            phone=fields.get("Phone", "")
+        )
 
 
 
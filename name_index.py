@@ -0,0 +1,104 @@
+import math
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
+
+
+@lru_cache(maxsize=65536)
+def sorted_tokens(name: str) -> str:
+    """
+    Returns the whitespace tokens of a name sorted and joined by single spaces.
+    This is the form token_sort_ratio actually compares, so two names score 100 exactly
+    when their sorted forms are equal.
+    """
+    return " ".join(sorted(name.split()))
+
+
+def bigrams(text: str) -> list[str]:
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+class NameIndex:
+    """
+    Candidate index over normalized member names.
+
+    Names are blocked on character bigrams of their sorted-token form and bucketed by length.
+    For a query and a token_sort_ratio threshold, candidates() returns every name that could
+    possibly reach the threshold, so scoring only the candidates gives the same best match
+    as scoring every name.
+
+    The filter relies on two bounds for the Indel distance d between strings of length la and lb:
+      - ratio >= threshold  implies  d <= (1 - threshold/100) * (la + lb)  and  |la - lb| <= d
+      - each insertion or deletion destroys at most two bigrams, so the strings share at
+        least (la - 1) - 2d bigrams
+    """
+    def __init__(self, names, sorted_names=None):
+        self.names = list(names)
+        self.sorted_names = list(sorted_names) if sorted_names is not None else [sorted_tokens(n) for n in self.names]
+        self.exact = defaultdict(list)
+        self.postings = defaultdict(list)
+        self.by_length = defaultdict(list)
+        self.lengths = [len(n) for n in self.sorted_names]
+        self.max_length = max(self.lengths, default=0)
+
+        for idx, sorted_name in enumerate(self.sorted_names):
+            self.exact[sorted_name].append(idx)
+            # Postings keep one entry per occurrence so that counts over-estimate shared bigrams
+            for gram in bigrams(sorted_name):
+                self.postings[gram].append(idx)
+            self.by_length[len(sorted_name)].append(idx)
+
+    def __len__(self):
+        return len(self.names)
+
+    def exact_matches(self, name: str) -> list[int]:
+        """
+        Returns the positions (in insertion order) of the names that score 100 against name.
+        """
+        return self.exact.get(sorted_tokens(name), [])
+
+    @staticmethod
+    def _max_distance(la, lb, threshold):
+        # Small slack so float rounding can only widen the candidate set
+        return math.floor((1 - threshold / 100) * (la + lb) + 1e-9)
+
+    def candidates(self, name: str, threshold: float) -> list[int]:
+        """
+        Returns the positions (in insertion order) of all names that may score >= threshold
+        against name with token_sort_ratio.
+
+        Parameters:
+            name (str): Normalized name to look up.
+            threshold (float): token_sort_ratio threshold between 0 and 100.
+
+        Returns:
+            list[int]: Sorted indexes into self.names.
+        """
+        query = sorted_tokens(name)
+        la = len(query)
+        if la < 2 or threshold <= 0:
+            return list(range(len(self.names)))
+
+        # Minimum number of shared bigrams for each candidate length, or None when no name of
+        # that length can reach the threshold
+        c = 1 - threshold / 100
+        max_lb = self.max_length if c >= 1 else min(self.max_length, math.floor(la * (1 + c) / (1 - c) + 1e-9))
+        required = [None] * (self.max_length + 1)
+        for lb in range(max_lb + 1):
+            d = self._max_distance(la, lb, threshold)
+            if abs(la - lb) <= d:
+                required[lb] = (la - 1) - 2 * d
+
+        # Names sharing at least one bigram, with an upper bound on how many they share
+        shared = Counter(chain.from_iterable(self.postings.get(g, ()) for g in bigrams(query)))
+        lengths = self.lengths
+        result = [idx for idx, count in shared.items()
+                  if required[lengths[idx]] is not None and count >= required[lengths[idx]]]
+
+        # Names sharing no bigram at all can only match when the bigram bound allows zero
+        for lb, need in enumerate(required):
+            if need is not None and need <= 0:
+                result.extend(idx for idx in self.by_length.get(lb, ()) if idx not in shared)
+
+        result.sort()
+        return result
@@ -1,12 +1,22 @@
-import pdfplumber
 import math
 import json
 import os
-from dataclasses import dataclass
+import hashlib
+import shutil
 import csv
+import re
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+
+from atomic_file import atomic_write
 
 # Data structure for a race result entry
 class Result:
+    __slots__ = ('place', 'name', 'time', 'pace', 'age', 'gender', 'city', 'state',
+                 'is_member', 'points', 'division', 'race_index', 'member')
+
     def __init__(self, place, name, time, pace, age, gender, city, state):
         self.place = int(place)
         self.name = name
@@ -24,11 +34,14 @@ class Result:
         self.points = 0
         self.division = None
         self.race_index = None
+        self.member = None
 
     def set_race_index(self, race_index: int):
         self.race_index = race_index
 
     def set_membership(self, member, race_date):
+        # Keep the matched member so scoring doesn't have to match this finisher again
+        self.member = member
         if member is not None:
             # Override gender in case it got missed
             if self.gender is None:
@@ -59,6 +72,165 @@ class Result:
             self.division = f"{self.gender.upper()}0119"
 
 
+# Matches 25:04, 1:02:03 and either with fractional seconds, e.g. 25:04.7
+_TIME_RE = re.compile(r'(\d+):(\d{2})(?::(\d{2}))?(?:\.(\d{1,3}))?')
+
+def parse_time_seconds(text):
+    """
+    Parses a finish time or pace into seconds.
+
+    Returns:
+        tuple: (seconds, style) where style records how the text was written (number of fields,
+        width of the first field and fractional digits) so format_time_seconds can write it back,
+        or None if the text isn't a time.
+    """
+    if not isinstance(text, str):
+        return None
+    match = _TIME_RE.fullmatch(text)
+    if match is None or len(match.group(1)) > 9:
+        return None
+    first, second, third, frac = match.groups()
+    if third is None:
+        seconds = int(first) * 60 + int(second)
+        fields = 2
+    else:
+        seconds = int(first) * 3600 + int(second) * 60 + int(third)
+        fields = 3
+    digits = len(frac) if frac else 0
+    if digits:
+        seconds += int(frac) / 10 ** digits
+    return seconds, fields * 100 + len(first) * 10 + digits
+
+def format_time_seconds(seconds, style):
+    """
+    Inverse of parse_time_seconds.
+    """
+    fields, width, digits = style // 100, (style // 10) % 10, style % 10
+    scaled = int(round(seconds * 10 ** digits))
+    whole, frac = divmod(scaled, 10 ** digits)
+    if fields == 3:
+        text = f"{whole // 3600:0{width}d}:{whole % 3600 // 60:02d}:{whole % 60:02d}"
+    else:
+        text = f"{whole // 60:0{width}d}:{whole % 60:02d}"
+    if digits:
+        text += f".{frac:0{digits}d}"
+    return text
+
+
+class ResultTable:
+    """
+    Columnar storage for a list of Results.
+
+    Each field is a NumPy column: places, ages, points and race indexes as ints (-1 for None),
+    times and paces as float seconds, and gender, city, state and division as integer codes into
+    a small vocabulary. Names are kept as one UTF-8 buffer with offsets. Times and paces that
+    format_time_seconds can't reproduce exactly (odd formats, None) are kept as text on the side,
+    so converting back gives the same values that went in. The matched member is not stored.
+    """
+    categorical = ('gender', 'city', 'state', 'division')
+    timed = ('time', 'pace')
+
+    def __init__(self, columns: dict):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns['place'])
+
+    @classmethod
+    def from_results(cls, results) -> 'ResultTable':
+        import numpy as np
+
+        results = list(results)
+        columns = {
+            'place': np.array([r.place for r in results], dtype=np.int32),
+            'age': np.array([-1 if r.age is None else r.age for r in results], dtype=np.int16),
+            'points': np.array([r.points for r in results], dtype=np.int16),
+            'race_index': np.array([-1 if r.race_index is None else r.race_index for r in results], dtype=np.int16),
+            'is_member': np.array([r.is_member for r in results], dtype=bool),
+        }
+
+        for field in cls.categorical:
+            values = [getattr(r, field) for r in results]
+            vocab = sorted({v for v in values if v is not None})
+            lookup = {v: code for code, v in enumerate(vocab)}
+            columns[field] = np.array([-1 if v is None else lookup[v] for v in values], dtype=np.int16)
+            columns[f'{field}_vocab'] = np.array(vocab, dtype=str)
+
+        for field in cls.timed:
+            seconds = np.full(len(results), np.nan)
+            styles = np.zeros(len(results), dtype=np.int16)
+            text_index, text = [], []
+            for i, r in enumerate(results):
+                value = getattr(r, field)
+                parsed = parse_time_seconds(value)
+                if parsed is not None and format_time_seconds(*parsed) == value:
+                    seconds[i], styles[i] = parsed
+                elif value is not None:
+                    text_index.append(i)
+                    text.append(value)
+            columns[field] = seconds
+            columns[f'{field}_style'] = styles
+            columns[f'{field}_text_index'] = np.array(text_index, dtype=np.int32)
+            columns[f'{field}_text'] = np.array(text, dtype=str)
+
+        encoded = [r.name.encode('utf-8') for r in results]
+        columns['name_offsets'] = np.cumsum([0] + [len(e) for e in encoded], dtype=np.int64)
+        columns['name_buffer'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return cls(columns)
+
+    def names(self) -> list[str]:
+        buffer = self.columns['name_buffer'].tobytes()
+        offsets = self.columns['name_offsets'].tolist()
+        return [buffer[a:b].decode('utf-8') for a, b in zip(offsets, offsets[1:])]
+
+    def decoded(self, field) -> list:
+        """
+        Returns a categorical or time column as Python values, with None where nothing was stored.
+        """
+        col = self.columns
+        if field in self.categorical:
+            vocab = col[f'{field}_vocab'].tolist()
+            return [None if code < 0 else vocab[code] for code in col[field].tolist()]
+
+        values = [None if style == 0 else format_time_seconds(seconds, style)
+                  for seconds, style in zip(col[field].tolist(), col[f'{field}_style'].tolist())]
+        for i, text in zip(col[f'{field}_text_index'].tolist(), col[f'{field}_text'].tolist()):
+            values[i] = text
+        return values
+
+    def save(self, path):
+        """
+        Writes the table to an uncompressed .npz file, which loads back in milliseconds.
+        """
+        import numpy as np
+
+        with atomic_write(path, 'wb') as f:
+            np.savez(f, **self.columns)
+
+    @classmethod
+    def load(cls, path) -> 'ResultTable':
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as data:
+            return cls({name: data[name] for name in data.files})
+
+    def to_results(self) -> list[Result]:
+        col = self.columns
+        fields = zip(col['place'].tolist(), self.names(), self.decoded('time'), self.decoded('pace'),
+                     col['age'].tolist(), self.decoded('gender'), self.decoded('city'), self.decoded('state'),
+                     col['is_member'].tolist(), col['points'].tolist(), self.decoded('division'),
+                     col['race_index'].tolist())
+        results = []
+        for place, name, time, pace, age, gender, city, state, is_member, points, division, race_index in fields:
+            r = Result(place, name, time, pace, None if age < 0 else age, gender, city, state)
+            r.is_member = is_member
+            r.points = points
+            r.division = division
+            r.race_index = None if race_index < 0 else race_index
+            results.append(r)
+        return results
+
+
 class Column:
     def __init__(self, name):
         self.name = name
@@ -86,6 +258,67 @@ class Column:
             return False
 
 
+# Fields read from every row of a PDF
+PDF_FIELDS = ['place', 'name', 'time', 'pace', 'age', 'gender', 'city', 'state']
+
+class ColumnLayout:
+    """
+    Precomputed column spans for the current PDF header.
+
+    Each field is resolved once to the first column carrying it as an alias. A row's words are
+    then bucketed into those columns with a bisect over the sorted column offsets, so every field
+    of the row is read from one pass over its words.
+    """
+    delta = 0.01
+
+    def __init__(self, columns: list[Column], fields=PDF_FIELDS):
+        alias_to_column = {}
+        for col in columns:
+            for alias in col.aliases:
+                alias_to_column.setdefault(alias.lower(), col)
+
+        # Spans for the distinct columns the fields resolve to, sorted by left edge
+        span_columns = []
+        for field in fields:
+            col = alias_to_column.get(field)
+            if col is not None and col.offset >= 0 and not any(col is c for c in span_columns):
+                span_columns.append(col)
+        span_columns.sort(key=lambda c: c.offset)
+
+        self.lows = [col.offset - self.delta for col in span_columns]
+        self.highs = [col.right_bound + self.delta for col in span_columns]
+        # Spans from a single header don't overlap, so right edges are sorted too and the spans
+        # containing a word form one contiguous range
+        self.sorted_highs = all(a <= b for a, b in zip(self.highs, self.highs[1:]))
+
+        self.field_spans = {}
+        for field in fields:
+            col = alias_to_column.get(field)
+            self.field_spans[field] = next((i for i, c in enumerate(span_columns) if c is col), None)
+
+    def read_row(self, row) -> dict:
+        """
+        Returns {field: text} for a row, joining the words that fall in each field's column.
+        Fields with no column or no words are None.
+        """
+        buckets = [[] for _ in self.lows]
+        for word in row:
+            last = bisect_right(self.lows, word['x0']) - 1
+            if last < 0:
+                continue
+            if self.sorted_highs:
+                spans = range(bisect_left(self.highs, word['x1']), last + 1)
+            else:
+                spans = [i for i in range(last + 1) if word['x1'] <= self.highs[i]]
+            for i in spans:
+                buckets[i].append(word['text'])
+
+        values = {}
+        for field, span in self.field_spans.items():
+            values[field] = " ".join(buckets[span]) if span is not None and buckets[span] else None
+        return values
+
+
 def convert_milliseconds_to_time_string(milliseconds):
     """
     Convert milliseconds to a readable time format (HH:MM:SS or MM:SS).
@@ -162,7 +395,33 @@ def extract_location_info(location_data):
 
     return city, state
 
-def extract_results(race, race_index: int, file_path, gender=None):
+# Bump whenever a parser change would alter extracted results, so stale cache entries are ignored
+PARSER_VERSION = 1
+RESULTS_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'results')
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def results_cache_path(file_path, results_type, gender=None, cache_dir=RESULTS_CACHE_DIR):
+    """
+    Returns where the parsed results of a file are cached. The name is derived from the file's
+    content hash, the results type, the file gender and PARSER_VERSION.
+    """
+    key = f"{file_digest(file_path)}\x1e{results_type}\x1e{gender}\x1e{PARSER_VERSION}"
+    return os.path.join(cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.npz')
+
+def clear_results_cache(cache_dir=RESULTS_CACHE_DIR):
+    """
+    Deletes every cached parse.
+    """
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
+
+def extract_results(race, race_index: int, file_path, gender=None, workers: int = 1, cache: bool = False):
     """
     Extract race results from a file, automatically detecting the file format.
 
@@ -172,140 +431,265 @@ def extract_results(race, race_index: int, file_path, gender=None):
     Parameters:
         file_path : str
             The full path to the results file to be processed.
+        workers : int
+            Number of processes used to read the pages of a PDF. Ignored for other formats.
+        cache : bool
+            Reuse results parsed from a file with the same content, and cache new parses.
 
     Returns:
-        results : object
-            The extracted race results data structure. The exact type depends on 
-            the implementation of the underlying extraction functions.
+        results : list[Result]
+            The extracted race results, with race_index set on each.
 
     Raises
         Exception
             If the file format is not supported (neither .pdf nor .json).
 
     """
+    return list(iter_results(race, race_index, file_path, gender, workers, cache))
+
+def iter_results(race, race_index: int, file_path, gender=None, workers: int = 1, cache: bool = False):
+    """
+    Streaming version of extract_results. Yields Result objects page by page for PDFs and
+    record by record for the other formats, so large events never have to be held in memory
+    all at once. With cache=True, a cached parse is yielded if there is one; otherwise the
+    results are collected as they stream and cached once the file has been read.
+
+    Raises
+        Exception
+            If race.results_type is not supported. Raised on the first next().
+    """
+    cache_path = results_cache_path(file_path, race.results_type, gender) if cache else None
+    if cache_path is not None and os.path.exists(cache_path):
+        for r in ResultTable.load(cache_path).to_results():
+            r.set_race_index(race_index)
+            yield r
+        return
 
     if race.results_type == 'pdf':
-        results = extract_results_from_pdf(file_path, gender)
+        results = iter_results_from_pdf(file_path, gender, workers=workers)
     elif race.results_type == 'athlinks':
-        results = extract_results_from_athlinks(file_path, gender)
+        results = iter_results_from_athlinks(file_path, file_gender=gender)
     elif race.results_type == 'raceresult':
-        results = extract_results_from_raceresult(file_path, gender)
+        results = iter_results_from_raceresult(file_path, gender)
     elif race.results_type == 'csv':
-        results = extract_results_from_csv(file_path, gender)
+        results = iter_results_from_csv(file_path, gender)
     else:
         raise Exception(f"Unsupported file format: {race.results_type} for file {file_path}")
+
+    parsed = [] if cache_path is not None else None
     for r in results:
+        if parsed is not None:
+            # Copy the parsed fields now; the consumer may score r before the file is finished
+            parsed.append(Result(r.place, r.name, r.time, r.pace, r.age, r.gender, r.city, r.state))
         r.set_race_index(race_index)
+        yield r
+
+    if parsed is not None:
+        ResultTable.from_results(parsed).save(cache_path)
+
+# raceresult exports at least this size are streamed with ijson, when it's installed
+RACERESULT_STREAM_BYTES = 4 * 1024 * 1024
+# Rows converted at a time
+RACERESULT_CHUNK_ROWS = 1024
+
+# DataFields names accepted for each Result field, in order of preference
+RACERESULT_FIELD_PATTERNS = {
+    'place': ['WithStatus([AUTORANK.p])', 'WithStatus([OverallRank.p])', 'place', 'rank', 'position'],
+    'name': ['FLNAME', 'DisplayName', 'name', 'fullname', 'participant'],
+    'time': ['Finish.GUN', 'finish_time', 'gun_time', 'time', 'total_time'],
+    'pace': ['PACE', 'Finish.PACE', 'pace', 'avg_pace'],
+    'gender': ['GenderMF'],
+    'age': ['AGE', 'age', 'participant_age'],
+    'city': ['CITY', 'city', 'hometown'],
+    'state': ['STATE2', 'STATE', 'state', 'province']
+}
+
+
+def _raceresult_field_mapping(data_fields) -> dict:
+    """Create a field mapping using exact field name matches."""
+    mapping = {}
+    for field_type, patterns in RACERESULT_FIELD_PATTERNS.items():
+        for pattern in patterns:
+            if pattern in data_fields:
+                mapping[field_type] = data_fields.index(pattern)
+                break
+    return mapping
+
+
+def _format_raceresult_name(name_str):
+    """Format name from 'Last, First' to 'First Last' if comma is present."""
+    if not name_str or ',' not in name_str:
+        return name_str
 
-    return results
-
-def extract_results_from_raceresult(json_path: str, file_gender = None) -> list[Result]:
-    """
-    Extract race results from raceresult JSON file and convert to Result objects.
-
-    This method reads a JSON file from raceresult.com and converts each entry 
-    to a Result object matching the format used by other parsers.
-
-    Args:
-        json_path (str): Path to the JSON file containing race results
+    last_name, first_name = name_str.split(',', 1)
+    return f"{first_name.strip()} {last_name.strip()}"
 
-    Returns:
-        list[Result]: List of Result objects extracted from the JSON data
 
-    Raises:
-        FileNotFoundError: If the JSON file cannot be found
-        json.JSONDecodeError: If the JSON file is malformed
-        KeyError: If required fields are missing from the JSON data
+class RaceresultExtractor:
     """
-    results = []
-
-    def create_field_mapping(data_fields):
-        """Create a field mapping using exact field name matches."""
-
-        # Define expected field patterns with their possible variations
-        field_patterns = {
-            'place': ['WithStatus([AUTORANK.p])', 'WithStatus([OverallRank.p])', 'place', 'rank', 'position'],
-            'name': ['FLNAME', 'DisplayName', 'name', 'fullname', 'participant'],
-            'time': ['Finish.GUN', 'finish_time', 'gun_time', 'time', 'total_time'],
-            'pace': ['PACE', 'Finish.PACE', 'pace', 'avg_pace'],
-            'gender': ['GenderMF'],
-            'age': ['AGE', 'age', 'participant_age'],
-            'city': ['CITY', 'city', 'hometown'],
-            'state': ['STATE2', 'STATE', 'state', 'province']
-        }
-
-        mapping = {}
-
-        for field_type, patterns in field_patterns.items():
-            for pattern in patterns:
-                if pattern in data_fields:
-                    mapping[field_type] = data_fields.index(pattern)
-                    break
-
-        return mapping
+    Converts raceresult data rows to Results, compiled once per file from its DataFields.
 
-    def format_name(name_str):
-        """Format name from 'Last, First' to 'First Last' if comma is present."""
-        if not name_str or ',' not in name_str:
-            return name_str
+    The mapped columns are pulled out of each row with a single itemgetter, and each chunk of
+    rows is then converted column by column. Missing, empty and out of range values fall back
+    to the same defaults as before: place 0, name 'Unknown', time and pace '0:00', no age,
+    the file's gender and an empty city and state.
 
-        parts = name_str.split(',', 1)
-        if len(parts) == 2:
-            last_name = parts[0].strip()
-            first_name = parts[1].strip()
-            return f"{first_name} {last_name}"
-
-        return name_str
+    Parameters:
+        data_fields (list): The export's DataFields.
+        file_gender (str): Gender to use for rows without one.
+    """
+    def __init__(self, data_fields, file_gender=None):
+        mapping = _raceresult_field_mapping(data_fields)
+        self.file_gender = file_gender
+        self.fields = list(mapping)
+        indices = [mapping[field] for field in self.fields]
+        self.width = max(indices, default=-1) + 1
+        if len(indices) > 1:
+            self._getter = itemgetter(*indices)
+        elif indices:
+            index = indices[0]
+            self._getter = lambda row: (row[index],)
+        else:
+            self._getter = lambda row: ()
+
+    def extract(self, row) -> dict:
+        """
+        Returns field -> raw value for a row, None where the value is missing or empty.
+        """
+        if len(row) < self.width:
+            row = list(row) + [None] * (self.width - len(row))
+        return {field: value or None for field, value in zip(self.fields, self._getter(row))}
+
+    def convert_row(self, row) -> Result:
+        values = self.extract(row)
+        place = values.get('place')
+        age = values.get('age')
+        return Result(
+            int(place.rstrip('.')) if place else 0,
+            _format_raceresult_name(values.get('name') or 'Unknown'),
+            values.get('time') or '0:00',
+            values.get('pace') or '0:00',
+            int(age) if age else None,
+            values.get('gender') or self.file_gender,
+            values.get('city') or '',
+            values.get('state') or '')
+
+    def convert_rows(self, rows) -> list[Result]:
+        """
+        Converts a chunk of rows column by column. Raises on the first bad value; use
+        convert_row to find and skip it.
+        """
+        getter, width = self._getter, self.width
+        pad = [None] * width
+        picked = [getter(row if len(row) >= width else list(row) + pad[len(row):]) for row in rows]
+        columns = dict(zip(self.fields, zip(*picked)))
+        missing = (None,) * len(rows)
+
+        places = [int(v.rstrip('.')) if v else 0 for v in columns.get('place', missing)]
+        names = [_format_raceresult_name(v or 'Unknown') for v in columns.get('name', missing)]
+        times = [v or '0:00' for v in columns.get('time', missing)]
+        paces = [v or '0:00' for v in columns.get('pace', missing)]
+        ages = [int(v) if v else None for v in columns.get('age', missing)]
+        genders = [v or self.file_gender for v in columns.get('gender', missing)]
+        cities = [v or '' for v in columns.get('city', missing)]
+        states = [v or '' for v in columns.get('state', missing)]
+
+        return [Result(*values) for values in zip(places, names, times, paces, ages, genders, cities, states)]
+
+    def iter_results(self, rows, chunk_size=RACERESULT_CHUNK_ROWS):
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            try:
+                results = self.convert_rows(chunk)
+            except Exception:
+                # Redo the chunk a row at a time so only the bad rows are skipped
+                results = None
+            if results is not None:
+                yield from results
+                continue
 
-    def safe_extract_value(entry, field_mapping, field_type):
-        """Safely extract a value from entry using field mapping."""
-        if field_type in field_mapping:
-            idx = field_mapping[field_type]
-            if idx < len(entry) and entry[idx] and entry[idx] != '':
-                return entry[idx]
-        return None
+            for row in chunk:
+                try:
+                    result = self.convert_row(row)
+                except (ValueError, TypeError, IndexError) as e:
+                    print(f"Warning: Skipping racer entry due to error: {e}")
+                    continue
+                yield result
 
-    try:
-        # Load JSON data from file
-        with open(json_path, 'r') as file:
-            json_data = json.load(file)
 
-        # Get the data fields mapping and race data
-        data_fields = json_data.get('DataFields', [])
-        race_data = json_data.get('data', [])
+def _iter_json_items(json_path, prefix, ijson):
+    with open(json_path, 'rb') as file:
+        yield from ijson.items(file, prefix, use_float=True)
 
-        # Create field mapping
-        field_mapping = create_field_mapping(data_fields)
 
-        # Process each racer entry
-        for entry in race_data:
-            try:
-                # Extract data using field mapping
-                place_raw = safe_extract_value(entry, field_mapping, 'place')
-                place = int(place_raw.rstrip('.')) if place_raw else 0
+def read_raceresult_json(json_path: str, stream=None):
+    """
+    Reads a raceresult export, streaming the data rows if possible.
 
-                name_raw = safe_extract_value(entry, field_mapping, 'name') or 'Unknown'
-                name = format_name(name_raw)
+    Parameters:
+        json_path (str): Path to the JSON file.
+        stream (bool): Stream the rows with ijson, an optional dependency, instead of loading
+            the whole document. None streams files of at least RACERESULT_STREAM_BYTES. Without
+            ijson installed, or when data isn't a list of rows, the file is loaded with json.
 
-                time = safe_extract_value(entry, field_mapping, 'time') or '0:00'
-                pace = safe_extract_value(entry, field_mapping, 'pace') or '0:00'
+    Returns:
+        tuple: (DataFields, iterable of data rows)
+    """
+    if stream is None:
+        stream = os.path.getsize(json_path) >= RACERESULT_STREAM_BYTES
+
+    if stream:
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        if ijson is not None:
+            # Two passes, so the rows can be streamed even if DataFields comes after data
+            with open(json_path, 'rb') as file:
+                data_fields = next(ijson.items(file, 'DataFields'), [])
+            with open(json_path, 'rb') as file:
+                data_start = next((event for prefix, event, _ in ijson.parse(file) if prefix == 'data'), None)
+            if data_start == 'start_array':
+                return data_fields, _iter_json_items(json_path, 'data.item', ijson)
+
+    with open(json_path, 'r') as file:
+        json_data = json.load(file)
+    return json_data.get('DataFields', []), json_data.get('data', [])
+
+
+def extract_results_from_raceresult(json_path: str, file_gender = None, stream=None) -> list[Result]:
+    """
+    List version of iter_results_from_raceresult.
+    """
+    return list(iter_results_from_raceresult(json_path, file_gender, stream))
 
-                age_raw = safe_extract_value(entry, field_mapping, 'age')
-                age = int(age_raw) if age_raw else None
+def iter_results_from_raceresult(json_path: str, file_gender = None, stream=None):
+    """
+    Extract race results from raceresult JSON file and convert to Result objects.
 
-                gender_extract = safe_extract_value(entry, field_mapping, 'gender')
-                gender = gender_extract if gender_extract else file_gender
+    This method reads a JSON file from raceresult.com and converts each entry 
+    to a Result object matching the format used by other parsers.
 
-                age_raw = safe_extract_value(entry, field_mapping, 'age')
-                city = safe_extract_value(entry, field_mapping, 'city') or ''
-                state = safe_extract_value(entry, field_mapping, 'state') or ''
+    Args:
+        json_path (str): Path to the JSON file containing race results
+        file_gender (str): Gender to use for entries without one
+        stream (bool): Stream the entries with ijson; see read_raceresult_json
 
-                result = Result(place, name, time, pace, age, gender, city, state)
-                results.append(result)
+    Yields:
+        Result: Result objects extracted from the JSON data, one entry at a time
 
-            except (ValueError, TypeError, IndexError) as e:
-                print(f"Warning: Skipping racer entry due to error: {e}")
-                continue
+    Raises:
+        FileNotFoundError: If the JSON file cannot be found
+        json.JSONDecodeError: If the JSON file is malformed (ijson.JSONError when streaming)
+        KeyError: If required fields are missing from the JSON data
+    """
+    try:
+        data_fields, race_data = read_raceresult_json(json_path, stream)
+        yield from RaceresultExtractor(data_fields, file_gender).iter_results(race_data)
 
     except FileNotFoundError:
         print(f"Error: JSON file '{json_path}' not found.")
@@ -317,9 +701,13 @@ def extract_results_from_raceresult(json_path: str, file_gender = None) -> list[
         print(f"Unexpected error processing JSON file: {e}")
         raise
 
-    return results
-
 def extract_results_from_athlinks(json_path: str, race_distance_miles: float = 3.1, file_gender = None) -> list[Result]:
+    """
+    List version of iter_results_from_athlinks.
+    """
+    return list(iter_results_from_athlinks(json_path, race_distance_miles, file_gender))
+
+def iter_results_from_athlinks(json_path: str, race_distance_miles: float = 3.1, file_gender = None):
     """
     Extract race results from JSON file and convert to Result objects.
 
@@ -330,15 +718,15 @@ def extract_results_from_athlinks(json_path: str, race_distance_miles: float = 3
         json_path (str): Path to the JSON file containing race results
         race_distance_miles (float): Distance of the race in miles (used for pace calculation)
 
-    Returns:
-        list[Result]: List of Result objects extracted from the JSON data
+    Yields:
+        Result: Result objects extracted from the JSON data, one racer at a time
 
     Raises:
         FileNotFoundError: If the JSON file cannot be found
         json.JSONDecodeError: If the JSON file is malformed
         KeyError: If required fields are missing from the JSON data
     """
-    results = []
+    count = 0
 
     try:
         # Load JSON data from file
@@ -364,7 +752,7 @@ def extract_results_from_athlinks(json_path: str, race_distance_miles: float = 3
                 # Overall place from rankings
                 place = racer.get('rankings', {}).get('overall', 0)
                 if place == 0:
-                    place = len(results) + 1  # Fallback to sequential numbering
+                    place = count + 1  # Fallback to sequential numbering
 
                 # Display name
                 name = racer.get('displayName', 'Unknown')
@@ -389,7 +777,8 @@ def extract_results_from_athlinks(json_path: str, race_distance_miles: float = 3
 
                 # Create Result object
                 result = Result(place, name, time, pace, age, gender, city, state)
-                results.append(result)
+                count += 1
+                yield result
 
             except (KeyError, ValueError, TypeError) as e:
                 # Log error and continue processing other entries
@@ -407,9 +796,13 @@ def extract_results_from_athlinks(json_path: str, race_distance_miles: float = 3
         print(f"Unexpected error processing JSON file: {e}")
         raise
 
-    return results
-
 def extract_results_from_csv(csv_path: str, file_gender=None) -> list[Result]:
+    """
+    List version of iter_results_from_csv.
+    """
+    return list(iter_results_from_csv(csv_path, file_gender))
+
+def iter_results_from_csv(csv_path: str, file_gender=None):
     """
     Extract race results from CSV file and convert to Result objects.
 
@@ -423,15 +816,13 @@ def extract_results_from_csv(csv_path: str, file_gender=None) -> list[Result]:
     Args:
         csv_path (str): Path to the CSV file containing race results
 
-    Returns:
-        list[Result]: List of Result objects extracted from the CSV data
+    Yields:
+        Result: Result objects extracted from the CSV data, one row at a time
 
     Raises:
         FileNotFoundError: If the CSV file cannot be found
         csv.Error: If the CSV file is malformed
     """
-    results = []
-
     try:
         with open(csv_path, 'r', newline='', encoding='utf-8') as file:
             csv_reader = csv.reader(file)
@@ -531,7 +922,7 @@ def extract_results_from_csv(csv_path: str, file_gender=None) -> list[Result]:
 
                     # Use overall place instead of gender-specific place
                     result = Result(overall_place, name, time, pace, age, gender, city, state)
-                    results.append(result)
+                    yield result
                     overall_place += 1
 
                 except (ValueError, IndexError, AttributeError) as e:
@@ -550,45 +941,90 @@ def extract_results_from_csv(csv_path: str, file_gender=None) -> list[Result]:
         print(f"Unexpected error processing CSV file: {e}")
         raise
 
-    return results
 
+def _extract_page_rows(page):
+    """
+    Groups the words on a PDF page into rows by their vertical position. Each row is sorted by x.
+    """
+    rows = []
+    current_row = []
+    previous_y = None
+    y_tolerance = 5
+    words = page.extract_words(x_tolerance=2, y_tolerance=2)
 
-# Extracts results from the PDF, handling multi-word names and cities
-def extract_results_from_pdf(pdf_path: str, file_gender) -> list[Result]:
-    results = []
-    columns = []
+    for word in words:
+        y0 = word['top']  # The y-coordinate of the top of the word
+        text = word['text']
+
+        # If y0 is significantly different from the previous row, start a new row
+        if previous_y is None or abs(y0 - previous_y) > y_tolerance:
+            if current_row:
+                rows.append(sorted(current_row, key=lambda w: w['x0']))  # Sort previous row by x-coordinates
+            current_row = [word]
+        else:
+            current_row.append(word)
+
+        previous_y = y0
+
+    # Add the last row
+    if current_row:
+        rows.append(sorted(current_row, key=lambda w: w['x0']))  # Sort last row by x-coordinates
+
+    return rows
+
+def _extract_rows_from_pages(pdf_path: str, start: int, stop: int):
+    """
+    Worker for page-parallel extraction: opens the PDF and returns the rows of pages [start, stop).
+    """
+    import pdfplumber
 
     rows = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            rows.extend(_extract_page_rows(page))
+    return rows
+
+def _iter_rows(pdf_path: str, workers: int = 1):
+    """
+    Yields the rows of every page of the PDF in page order, a page at a time. With workers > 1
+    the pages are split into contiguous ranges that are extracted in separate processes.
+    """
+    import pdfplumber
+
+    if workers <= 1:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                yield from _extract_page_rows(page)
+                # Drop the page's parsed objects so memory doesn't grow with the page count
+                page.close()
+        return
 
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            current_row = []
-            previous_y = None
-            y_tolerance = 5
-            words = page.extract_words(x_tolerance=2, y_tolerance=2)
-
-            for word in words:
-                y0 = word['top']  # The y-coordinate of the top of the word
-                text = word['text']
-
-                # If y0 is significantly different from the previous row, start a new row
-                if previous_y is None or abs(y0 - previous_y) > y_tolerance:
-                    if current_row:
-                        rows.append(sorted(current_row, key=lambda w: w['x0']))  # Sort previous row by x-coordinates
-                    current_row = [word]
-                else:
-                    current_row.append(word)
-
-                previous_y = y0
-
-            # Add the last row
-            if current_row:
-                rows.append(sorted(current_row, key=lambda w: w['x0']))  # Sort last row by x-coordinates
+        page_count = len(pdf.pages)
 
+    # A few ranges per worker so one slow range doesn't hold up the rest
+    chunk = max(1, math.ceil(page_count / (workers * 4)))
+    ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
 
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_extract_rows_from_pages, pdf_path, start, stop) for start, stop in ranges]
+        for future in futures:
+            yield from future.result()
 
-    # We have rows now
-    for row in rows:
+def extract_results_from_pdf(pdf_path: str, file_gender, workers: int = 1) -> list[Result]:
+    """
+    List version of iter_results_from_pdf.
+    """
+    return list(iter_results_from_pdf(pdf_path, file_gender, workers))
+
+# Extracts results from the PDF, handling multi-word names and cities. Results are yielded as each
+# page's rows are parsed. With workers > 1, pages are read in parallel processes; column detection
+# and parsing always run here on the rows in page order.
+def iter_results_from_pdf(pdf_path: str, file_gender, workers: int = 1):
+    columns = []
+    layout = None
+
+    for row in _iter_rows(pdf_path, workers):
 
         # Skip header lines
         if len(row) < 7 or has_text(row, "======="):
@@ -626,33 +1062,33 @@ def extract_results_from_pdf(pdf_path: str, file_gender) -> list[Result]:
                 new_column.set_offset(offset)
                 columns.append(new_column)
 
+            layout = ColumnLayout(columns)
             continue
         # Skip if we haven't found column headers yet
         if len(columns) == 0:
             continue
 
+        values = layout.read_row(row)
+
         # Mandatory values
-        time = get_value(row, columns, 'time')
-        name = get_value(row, columns, 'name')
-        age = get_value(row, columns, 'age')
-        gender = get_value(row, columns, 'gender')
+        time = values['time']
+        name = values['name']
+        age = values['age']
+        gender = values['gender']
         if gender is None:
             gender = file_gender
 
         # Optional values
-        pace = get_value(row, columns, 'pace')
-        place = get_value(row, columns, 'place')
-        city = get_value(row, columns, 'city')
-        state = get_value(row, columns, 'state')
+        pace = values['pace']
+        place = values['place']
+        city = values['city']
+        state = values['state']
 
 
         if time is None or name is None or age is None or gender is None:
             raise Exception(f"Failed to extract data from {row} in file {pdf_path}")
         # Build result object
-        results.append(Result(place, name, time, pace, age, gender, city, state))
-
-
-    return results
+        yield Result(place, name, time, pace, age, gender, city, state)
 
 def has_text(word_list, text):
     for w in word_list:
@@ -660,31 +1096,6 @@ def has_text(word_list, text):
             return True
     return False
 
-def get_value(row, columns: list[Column], column_name: str):
-
-    delta = 0.01
-
-    for col in columns:
-        if col.is_alias(column_name):
-
-            if col.offset < 0:
-                return None
-
-            value = None
-            for word in row:
-
-                if word['x0'] >= col.offset - delta and word['x1'] <= col.right_bound + delta:
-                    if value is None:
-                        value = word['text']
-                    else:
-                        # Append space + word text
-                        value = f"{value} {word['text']}"
-
-            return value
-
-    return None
-
-
 
 # Example usage function to demonstrate both PDF and JSON parsing
 def main():
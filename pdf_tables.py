@@ -0,0 +1,235 @@
+"""
+Writes simple tabular PDFs directly as vector text and lines.
+
+Only the standard Helvetica fonts are used, so nothing is embedded and no layout engine is
+needed: text is measured with the fonts' built-in metrics and tables flow down the page,
+continuing on a new page when they run out of room.
+"""
+import zlib
+
+LETTER_LANDSCAPE = (792, 612)
+
+REGULAR = 'F1'
+BOLD = 'F2'
+
+# Advance widths of characters 32-126 in 1/1000 em, from the Adobe core font metrics
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+FONTS = {
+    REGULAR: ('Helvetica', _HELVETICA_WIDTHS),
+    BOLD: ('Helvetica-Bold', _HELVETICA_BOLD_WIDTHS),
+}
+# Width used for characters outside the table, such as accented letters
+_DEFAULT_WIDTH = 556
+
+
+def text_width(text: str, size: float, font: str = REGULAR) -> float:
+    """
+    Returns the width of text in points when set in font at size.
+    """
+    widths = FONTS[font][1]
+    total = 0
+    for char in text:
+        code = ord(char) - 32
+        total += widths[code] if 0 <= code < len(widths) else _DEFAULT_WIDTH
+    return total * size / 1000
+
+
+def _rgb(color: str) -> str:
+    # '#FFD700' -> '1.000 0.843 0.000'
+    color = color.lstrip('#')
+    return " ".join(f"{int(color[i:i + 2], 16) / 255:.3f}" for i in (0, 2, 4))
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+class PdfCanvas:
+    """
+    Accumulates drawing operators page by page and serializes them as a PDF.
+
+    Coordinates are PDF points with the origin at the bottom left of the page.
+    """
+    def __init__(self, page_size=LETTER_LANDSCAPE):
+        self.width, self.height = page_size
+        self.pages = []
+        self.ops = None
+        self.new_page()
+
+    def new_page(self):
+        self.ops = []
+        self.pages.append(self.ops)
+
+    def text(self, x, y, text, size=9, font=REGULAR, rotate=False):
+        """
+        Draws text with its baseline starting at (x, y), running upwards if rotate is set.
+        """
+        matrix = f"0 1 -1 0 {x:.2f} {y:.2f}" if rotate else f"1 0 0 1 {x:.2f} {y:.2f}"
+        self.ops.append(f"BT /{font} {size:g} Tf {matrix} Tm ({_escape(text)}) Tj ET")
+
+    def rect(self, x, y, width, height, fill=None, stroke=True, line_width=0.8):
+        if fill is not None:
+            self.ops.append(f"{_rgb(fill)} rg")
+        paint = 'B' if fill is not None and stroke else 'f' if fill is not None else 'S'
+        self.ops.append(f"{line_width:g} w {x:.2f} {y:.2f} {width:.2f} {height:.2f} re {paint}")
+        if fill is not None:
+            self.ops.append("0 g")
+
+    def save(self, filename):
+        objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None]
+        font_refs = []
+        for key, (base_font, _) in FONTS.items():
+            objects.append(f"<< /Type /Font /Subtype /Type1 /BaseFont /{base_font} "
+                           f"/Encoding /WinAnsiEncoding >>".encode())
+            font_refs.append(f"/{key} {len(objects)} 0 R")
+        resources = f"<< /Font << {' '.join(font_refs)} >> >>"
+
+        kids = []
+        for ops in self.pages:
+            content = zlib.compress("\n".join(ops).encode('cp1252', errors='replace'))
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content) + content + b"\nendstream")
+            objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.width} {self.height}] "
+                           f"/Contents {len(objects)} 0 R /Resources {resources} >>".encode())
+            kids.append(len(objects))
+        objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] /Count {len(kids)} >>".encode()
+
+        out = bytearray(b"%PDF-1.4\n")
+        offsets = []
+        for num, obj in enumerate(objects, 1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % num + obj + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        with open(filename, 'wb') as f:
+            f.write(out)
+
+
+# Smallest fraction of the table font size text is shrunk to when fitting a cell
+_MIN_FIT = 0.6
+
+
+def _fit(text, width, size, font):
+    # Shrink the font so text fits its cell, down to _MIN_FIT of the table size
+    needed = text_width(text, size, font)
+    if needed <= width:
+        return size
+    return max(size * _MIN_FIT, size * width / needed)
+
+
+def write_tables_pdf(filename, title, tables, page_size=LETTER_LANDSCAPE, margin=36, font_size=8,
+                     first_column_width=150, rotated_columns=()):
+    """
+    Writes titled tables to a PDF, flowing them down the pages.
+
+    A table that runs past the bottom of a page continues on the next one under its title
+    and header again. Header cells may hold several lines separated by newlines. Header and
+    body text is shrunk to fit its cell, and a header cell that still doesn't fit across its
+    column is drawn upwards like the rotated columns.
+
+    Parameters:
+        filename (str): PDF to write.
+        title (str): Document title, drawn at the top of the first page.
+        tables (list[dict]): Each with 'title', 'header' (list of str), 'rows' (list of lists
+            of str) and optionally 'fills' (a fill color or None per row).
+        page_size (tuple): Page width and height in points.
+        margin (float): Page margin in points.
+        font_size (float): Size of table text. Titles are scaled from it.
+        first_column_width (float): Width of the first (left aligned) column. The other columns
+            share the remaining width equally.
+        rotated_columns (iterable): Indexes of the columns whose header text is drawn upwards.
+    """
+    canvas = PdfCanvas(page_size)
+    usable_width = canvas.width - 2 * margin
+    row_height = font_size + 6
+    title_size = font_size * 2
+    leading = font_size + 1
+    rotated_columns = set(rotated_columns)
+
+    canvas.text((canvas.width - text_width(title, title_size * 1.5, BOLD)) / 2,
+                canvas.height - margin - title_size * 1.5, title, title_size * 1.5, BOLD)
+    y = canvas.height - margin - title_size * 1.5 - row_height
+
+    for table in tables:
+        header = table['header']
+        rows = table['rows']
+        fills = table.get('fills') or [None] * len(rows)
+        columns = len(header)
+        other_width = (usable_width - first_column_width) / max(columns - 1, 1)
+        widths = [first_column_width] + [other_width] * (columns - 1)
+        lefts = [margin + first_column_width + other_width * (i - 1) if i else margin for i in range(columns)]
+
+        rotated = set(rotated_columns)
+        for i, cell in enumerate(header):
+            if any(text_width(line, font_size * _MIN_FIT, BOLD) > widths[i] - 6 for line in cell.split('\n')):
+                rotated.add(i)
+
+        header_height = row_height
+        for i, cell in enumerate(header):
+            lines = cell.split('\n')
+            if i in rotated:
+                header_height = max(header_height, max(text_width(line, font_size, BOLD) for line in lines) + 8)
+            else:
+                header_height = max(header_height, leading * len(lines) + 6)
+
+        def start_table(caption):
+            nonlocal y
+            y -= title_size + 6
+            canvas.text(margin + (usable_width - text_width(caption, title_size, BOLD)) / 2, y, caption,
+                        title_size, BOLD)
+            y -= 6 + header_height
+            for i, (left, width, cell) in enumerate(zip(lefts, widths, header)):
+                canvas.rect(left, y, width, header_height)
+                lines = cell.split('\n')
+                if i in rotated:
+                    first_x = left + (width - leading * len(lines)) / 2 + font_size * 0.8
+                    for k, line in enumerate(lines):
+                        canvas.text(first_x + k * leading, y + 4, line, font_size, BOLD, rotate=True)
+                else:
+                    for k, line in enumerate(lines):
+                        line_y = y + header_height / 2 + (len(lines) / 2 - k - 1) * leading + 2
+                        size = _fit(line, width - 6, font_size, BOLD)
+                        canvas.text(left + (width - text_width(line, size, BOLD)) / 2, line_y, line, size, BOLD)
+
+        # Keep a title and header together with at least a few rows
+        needed = title_size + 12 + header_height + row_height * min(len(rows), 3)
+        if y - needed < margin:
+            canvas.new_page()
+            y = canvas.height - margin
+        start_table(table['title'])
+
+        for row, fill in zip(rows, fills):
+            if y - row_height < margin:
+                canvas.new_page()
+                y = canvas.height - margin
+                start_table(f"{table['title']} (continued)")
+            y -= row_height
+            baseline = y + (row_height - font_size * 0.72) / 2
+            for i, (left, width, cell) in enumerate(zip(lefts, widths, row)):
+                canvas.rect(left, y, width, row_height, fill=fill)
+                if not cell:
+                    continue
+                size = _fit(cell, width - 6, font_size, REGULAR)
+                x = left + 4 if i == 0 else left + (width - text_width(cell, size, REGULAR)) / 2
+                canvas.text(x, baseline, cell, size)
+
+        y -= row_height
+
+    canvas.save(filename)
+    return len(canvas.pages)
@@ -0,0 +1,91 @@
+import hashlib
+import os
+import pickle
+
+import yaml
+
+from atomic_file import atomic_write
+from match_cache import DEFAULT_CACHE_DIR
+from parse import PARSER_VERSION, file_digest
+
+# Bump when the stored payload, the key or the scoring rules change so old entries are ignored
+STORE_VERSION = 3
+
+
+def scoring_fingerprint(members: dict) -> str:
+    """
+    Hashes every member field that stored scoring depends on: the name and birth date used for
+    matching, plus the gender and membership years (and resulting active flag) that decide
+    whether a matched finisher scores and in which division.
+
+    Parameters:
+        members (dict): Mapping from normalized name to Member, as in Club.members.
+
+    Returns:
+        str: Hex digest identifying the roster as far as scoring is concerned.
+    """
+    h = hashlib.sha256()
+    for name, member in members.items():
+        birth_date = member.birth_date.isoformat() if member.birth_date else ''
+        h.update(f"{name}\x1f{birth_date}\x1f{member.gender or ''}\x1f{member.start_year}\x1f"
+                 f"{member.end_year}\x1f{int(member.active)}\x1e".encode('utf-8'))
+    return h.hexdigest()
+
+
+def race_key(entry: dict, race_index: int, file_paths: list[str], roster: str) -> str:
+    """
+    Builds the key a race's scored results are stored under.
+
+    It covers the race's YAML entry, its position in the season, the content of every source
+    file, the parser version that read them and the roster's scoring fingerprint (see
+    scoring_fingerprint), since membership decides who scores.
+    """
+    h = hashlib.sha256()
+    h.update(f"v{STORE_VERSION}\x1ep{PARSER_VERSION}\x1e{race_index}\x1e{roster}\x1e".encode('utf-8'))
+    h.update(yaml.safe_dump(entry, sort_keys=True).encode('utf-8'))
+    for path in file_paths:
+        h.update(file_digest(path).encode('utf-8'))
+    return h.hexdigest()
+
+
+class RaceStore:
+    """
+    Stores each race's parsed and scored results on disk, one pickle per race key.
+
+    A stored race holds every Result extracted for it plus the member name credited for each
+    scoring result, in the order the points were awarded. Member objects are not pickled;
+    they are looked up again in the club roster when the race is loaded.
+    """
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.directory = os.path.join(cache_dir, 'races')
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        """
+        Returns (results, scored) for a stored race, where scored is a list of
+        (index into results, member name), or None if the race isn't stored.
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def put(self, key, results, scored):
+        # Detach members so the pickle only holds race data
+        members = [r.member for r in results]
+        for r in results:
+            r.member = None
+        try:
+            with atomic_write(self._path(key), 'wb') as f:
+                pickle.dump((results, scored), f, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            for r, member in zip(results, members):
+                r.member = member
+
+    def clear(self):
+        for filename in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, filename))
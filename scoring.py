@@ -0,0 +1,74 @@
+def division_name(gender: str, decade: int) -> str:
+    """
+    Division label as Result.set_division writes it, e.g. M2029 (males 20-29) or F0119.
+    """
+    if decade == 0:
+        return f"{gender.upper()}0119"
+    return f"{gender.upper()}{decade}{decade+9}"
+
+
+def score_divisions(genders, ages, places, is_member):
+    """
+    Vectorized Grand Prix scoring for one race.
+
+    Finishers are grouped into divisions by integer key (gender code and decade), ranked by place
+    within their division with a stable lexsort, and members earn max(0, 11 - rank) points.
+    Finishers who tie on place keep their input order, as with the sort in process_gp_points.
+
+    Parameters:
+        genders (list): Gender of each finisher, or None if unknown.
+        ages (list): Age of each finisher, or None if unknown.
+        places (list): Overall place of each finisher.
+        is_member (list): Whether each finisher is an active club member.
+
+    Returns:
+        tuple: (divisions, points, order) where divisions holds each finisher's division name
+        (None without both gender and age), points is an int array, and order lists the
+        finishers that have a division, division by division in name order and by place within
+        each division.
+    """
+    import numpy as np
+
+    n = len(genders)
+    known = np.array([g is not None and a is not None for g, a in zip(genders, ages)], dtype=bool)
+    age = np.array([a if a is not None else 0 for a in ages], dtype=np.int64)
+    place = np.asarray(places, dtype=np.int64)
+    member = np.asarray(is_member, dtype=bool)
+
+    gender_vocab = sorted({g.upper() for g in genders if g is not None})
+    gender_codes = {g: code for code, g in enumerate(gender_vocab)}
+    gender = np.array([gender_codes[g.upper()] if g is not None else -1 for g in genders], dtype=np.int64)
+
+    # Division spans a decade except for <19
+    decade = np.where(age > 19, age // 10 * 10, 0)
+    stride = int(decade[known].max(initial=0)) + 10
+    key = gender * stride + decade
+
+    # Rank the divisions by name so they are processed in the same order as sorted(divisions)
+    keys = np.unique(key[known])
+    names = [division_name(gender_vocab[k // stride], k % stride) for k in keys.tolist()]
+    name_order = sorted(range(len(keys)), key=lambda i: names[i])
+    sorted_names = [names[i] for i in name_order]
+    name_rank = np.empty(len(keys), dtype=np.int64)
+    name_rank[name_order] = np.arange(len(keys))
+    division_rank = np.full(n, -1, dtype=np.int64)
+    division_rank[known] = name_rank[np.searchsorted(keys, key[known])]
+
+    # Stable sort by division then place; original index breaks ties
+    indices = np.flatnonzero(known)
+    order = indices[np.lexsort((place[indices], division_rank[indices]))]
+
+    # Rank within division = position - position of the division's first finisher + 1
+    sorted_rank = division_rank[order]
+    starts = np.flatnonzero(np.r_[True, sorted_rank[1:] != sorted_rank[:-1]]) if len(order) else np.array([], dtype=np.int64)
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    rank = np.arange(len(order)) - group_start + 1
+
+    points = np.zeros(n, dtype=np.int64)
+    points[order] = np.where(member[order], np.maximum(0, 11 - rank), 0)
+
+    divisions = [None] * n
+    for i, r in zip(indices.tolist(), division_rank[indices].tolist()):
+        divisions[i] = sorted_names[r]
+
+    return divisions, points, order
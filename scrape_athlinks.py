@@ -1,48 +1,144 @@
-import requests
+import argparse
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
 
-def fetch_all_race_results():
-    base_url = "https://reignite-api.athlinks.com/event/1119291/race/2628163/results"
-    limit = 100
-    all_results = []
+import requests
+from requests.adapters import HTTPAdapter
+
+from atomic_file import atomic_write
+
+BASE_URL = "https://reignite-api.athlinks.com"
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'athlinks')
+
 
-    # Initial request to get total count
-    params = {"correlationId": "", "from": 0, "limit": limit}
-    response = requests.get(base_url, params=params)
-    response.raise_for_status()
+class AthlinksFetcher:
+    """
+    Fetches every page of an Athlinks race's results.
 
-    data = response.json()
-    total_athletes = data["division"]["totalAthletes"]
+    Pages are requested with from=/limit= through one pooled requests.Session, a bounded number
+    at a time. Failed requests (connection errors, 429 and 5xx responses) are retried with
+    exponential backoff. Each raw page is saved under cache_dir and read back on later runs
+    unless refresh is set. base_url can point at a local stub server for testing.
+    """
+    def __init__(self, event_id, race_id, limit=100, max_workers=4, retries=4, backoff=0.5,
+                 cache_dir=DEFAULT_CACHE_DIR, refresh=False, base_url=BASE_URL, session=None):
+        self.event_id = event_id
+        self.race_id = race_id
+        self.limit = limit
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.cache_dir = cache_dir
+        self.refresh = refresh
+        self.url = f"{base_url}/event/{event_id}/race/{race_id}/results"
 
-    # Add results from first request
-    if "intervals" in data and len(data["intervals"]) > 0:
-        all_results.extend(data["intervals"][0]["results"])
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
 
-    # Calculate additional requests needed
-    total_requests = ceil(total_athletes / limit)
+    def _cache_path(self, from_param):
+        return os.path.join(self.cache_dir, f"{self.event_id}_{self.race_id}_{from_param}_{self.limit}.json")
 
-    # Make remaining requests
-    for i in range(1, total_requests):
-        from_param = i * limit
-        params = {"correlationId": "", "from": from_param, "limit": limit}
+    def _get(self, params):
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.get(self.url, params=params, timeout=30)
+                # Rate limiting and server errors are worth another try; other errors are not
+                if response.status_code != 429 and response.status_code < 500:
+                    response.raise_for_status()
+                    return response.json()
+                error = requests.HTTPError(f"{response.status_code} for {response.url}", response=response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
 
-        response = requests.get(base_url, params=params)
-        response.raise_for_status()
+            if attempt == self.retries:
+                raise error
+            time.sleep(self.backoff * 2 ** attempt)
 
-        data = response.json()
+    def fetch_page(self, from_param) -> dict:
+        """
+        Returns the raw JSON page starting at from_param, from the cache if it's there.
+        """
+        path = self._cache_path(from_param) if self.cache_dir else None
+        if path and not self.refresh and os.path.exists(path):
+            with open(path) as f:
+                return json.load(f)
+
+        data = self._get({"correlationId": "", "from": from_param, "limit": self.limit})
+
+        if path:
+            with atomic_write(path) as f:
+                json.dump(data, f)
+        return data
+
+    @staticmethod
+    def _page_results(data):
         if "intervals" in data and len(data["intervals"]) > 0:
-            all_results.extend(data["intervals"][0]["results"])
+            return data["intervals"][0]["results"]
+        return []
+
+    def fetch_all(self) -> list:
+        """
+        Returns the results of every page, in order.
+        """
+        # Initial request to get total count
+        first = self.fetch_page(0)
+        total_athletes = first["division"]["totalAthletes"]
+        total_requests = ceil(total_athletes / self.limit)
+
+        all_results = list(self._page_results(first))
 
-        print(f"Fetched batch {i+1}/{total_requests} (from={from_param})")
+        # Remaining pages, a bounded number in flight at a time; map keeps them in order
+        offsets = [i * self.limit for i in range(1, total_requests)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for i, data in enumerate(pool.map(self.fetch_page, offsets), 2):
+                all_results.extend(self._page_results(data))
+                print(f"Fetched batch {i}/{total_requests}")
+
+        return all_results
+
+
+def fetch_all_race_results(event_id, race_id, output_path, **fetcher_args):
+    """
+    Fetches all results for an Athlinks race and writes them to output_path as JSON.
+
+    Parameters:
+        event_id: Athlinks event ID
+        race_id: Athlinks race ID within the event
+        output_path (str): Where to write the combined results
+        fetcher_args: Passed through to AthlinksFetcher
+    """
+    all_results = AthlinksFetcher(event_id, race_id, **fetcher_args).fetch_all()
 
     # Write combined results to file
-    with open("2025_reggie_oeltjen.json", "w") as f:
+    with open(output_path, "w") as f:
         json.dump(all_results, f, indent=2)
 
     print(f"Total results collected: {len(all_results)}")
-    print("Results saved to race_results.json")
+    print(f"Results saved to {output_path}")
+    return all_results
 
-if __name__ == "__main__":
-    fetch_all_race_results()
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Download all results for an Athlinks race")
+    parser.add_argument('event_id')
+    parser.add_argument('race_id')
+    parser.add_argument('output', help="JSON file to write")
+    parser.add_argument('--limit', type=int, default=100, help="Results per page")
+    parser.add_argument('--workers', type=int, default=4, help="Pages requested at once")
+    parser.add_argument('--refresh', action='store_true', help="Ignore cached pages and download again")
+    parser.add_argument('--base-url', default=BASE_URL)
+    args = parser.parse_args(argv)
+
+    fetch_all_race_results(args.event_id, args.race_id, args.output, limit=args.limit,
+                           max_workers=args.workers, refresh=args.refresh, base_url=args.base_url)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import heapq
+
+# Only a member's best results count towards their Grand Prix total
+BEST_OF = 5
+
+
+class Standings:
+    """
+    Grand Prix standings for every member with results, computed in one pass.
+
+    Each entry is a dict with the member's display name, per-race points, total points, races
+    run, best-5 total and place within their division. Divisions hold their entries sorted by
+    best-5 total (highest first, roster order breaking ties); tied totals share a place.
+
+    Parameters:
+        members (dict): Mapping from normalized name to Member, as in Club.members.
+        race_count (int): Length of the per-race point vectors. Results for races past the end
+            are left out of the vector (but still count towards the totals). None sizes the
+            vectors to the highest race index seen.
+    """
+    def __init__(self, members, race_count=None):
+        self.entries = []
+        self.divisions = {}
+
+        scored = [member for member in members.values() if member.results and member.division is not None]
+        if race_count is None:
+            race_count = 1 + max((r.race_index for m in scored for r in m.results if r.race_index is not None),
+                                 default=-1)
+        self.race_count = race_count
+
+        for member in scored:
+            points = [result.points for result in member.results]
+
+            # Race results array ordered by race_index
+            race_results = [''] * race_count
+            for result in member.results:
+                if result.race_index is not None and result.race_index < race_count:
+                    race_results[result.race_index] = result.points
+
+            entry = {
+                'name': f"{member.first_name} {member.last_name}",
+                'race_results': race_results,
+                'total_points': sum(points),
+                'total_races': len(points),
+                'total_best_5': sum(heapq.nlargest(BEST_OF, points)),
+                'member': member,
+            }
+            self.entries.append(entry)
+            self.divisions.setdefault(member.division, []).append(entry)
+
+        # Sort and assign places, ties allowed
+        for division_entries in self.divisions.values():
+            division_entries.sort(key=lambda x: -x['total_best_5'])
+            current_place = 1
+            for i, entry in enumerate(division_entries):
+                if i > 0 and division_entries[i - 1]['total_best_5'] != entry['total_best_5']:
+                    current_place = i + 1
+                entry['place'] = current_place
@@ -0,0 +1,53 @@
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def stub_server():
+    """
+    Starts local HTTP servers for the duration of a test.
+
+    Call the fixture with respond(path, query) -> (status, JSON body) to start a server and get
+    its base URL. path is unquoted and query is the parsed query string, as from urllib.parse.parse_qs. Requests to
+    the latest server are recorded as (path, query) tuples in stub_server.requests.
+    """
+    servers = []
+
+    def start(respond):
+        requests_seen = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                path = unquote(url.path)
+                requests_seen.append((path, query))
+                status, body = respond(path, query)
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        servers.append(server)
+        start.requests = requests_seen
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
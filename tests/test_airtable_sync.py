@@ -0,0 +1,125 @@
+from datetime import timedelta
+
+import pytest
+import requests
+
+from airtable_sync import ID_LISTING_FIELD, SYNC_OVERLAP, AirtableSnapshot, sync_airtable_snapshot
+from member import Club
+
+PAGE_SIZE = 2
+
+
+def record(record_id, first, last, created="2024-01-01T00:00:00.000Z"):
+    return {"id": record_id, "createdTime": created,
+            "fields": {"First Name": first, "Last Name": last, "Gender": "F", "Birthday": "1980-05-01",
+                       "Submission Date": "2024-01-15"}}
+
+
+class FakeAirtable:
+    """
+    Serves a view's records in pages of PAGE_SIZE. Filtered requests get only the records in
+    changed, as if the filter formula had been applied.
+    """
+    def __init__(self, records):
+        self.view = list(records)
+        self.changed = set()
+
+    def __call__(self, path, query):
+        if path != "/base/Table 1":
+            return 404, {"error": "NOT_FOUND"}
+        rows = self.view
+        if "filterByFormula" in query:
+            rows = [r for r in rows if r["id"] in self.changed]
+        if "fields[]" in query:
+            rows = [dict(r, fields={f: r["fields"][f] for f in query["fields[]"] if f in r["fields"]})
+                    for r in rows]
+        start = int(query.get("offset", ["0"])[0])
+        body = {"records": rows[start:start + PAGE_SIZE]}
+        if start + PAGE_SIZE < len(rows):
+            body["offset"] = str(start + PAGE_SIZE)
+        return 200, body
+
+
+def sync(url, tmp_path, **kwargs):
+    return sync_airtable_snapshot("base", "Table 1", "Active Members", "token", cache_dir=str(tmp_path),
+                                  base_url=url, session=requests.Session(), **kwargs)
+
+
+@pytest.fixture
+def airtable(stub_server):
+    fake = FakeAirtable([record("rec3", "Cara", "Olsen", "2024-03-01T00:00:00.000Z"),
+                         record("rec1", "Ann", "Berg", "2024-01-01T00:00:00.000Z"),
+                         record("rec2", "Bea", "Lund", "2024-02-01T00:00:00.000Z")])
+    return fake, stub_server(fake), stub_server
+
+
+def test_first_sync_follows_offsets_and_keeps_view_order(airtable, tmp_path):
+    fake, url, server = airtable
+
+    snapshot = sync(url, tmp_path)
+
+    assert [r["id"] for r in snapshot.ordered_records()] == ["rec3", "rec1", "rec2"]
+    assert [q.get("offset") for _, q in server.requests] == [None, ["2"]]
+    assert all(q["view"] == ["Active Members"] for _, q in server.requests)
+    assert not any("filterByFormula" in q for _, q in server.requests)
+    assert [r["id"] for r in AirtableSnapshot("base", "Table 1", "Active Members", str(tmp_path)).ordered_records()] \
+        == ["rec3", "rec1", "rec2"]
+
+
+def test_incremental_sync_fetches_changes_since_last_sync(airtable, tmp_path):
+    fake, url, server = airtable
+    first = sync(url, tmp_path)
+    server.requests.clear()
+
+    fake.view[1] = record("rec1", "Anne", "Berg")
+    fake.view.insert(0, record("rec4", "Dee", "Holm", "2024-04-01T00:00:00.000Z"))
+    fake.changed = {"rec1", "rec4"}
+    snapshot = sync(url, tmp_path)
+
+    changes = [q for _, q in server.requests if "filterByFormula" in q]
+    since = (first.synced_at - SYNC_OVERLAP).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    assert changes and all(q["filterByFormula"] == [f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{since}'))"]
+                           for q in changes)
+    assert snapshot.synced_at - first.synced_at < timedelta(minutes=1)
+    assert snapshot.records["rec1"]["fields"]["First Name"] == "Anne"
+    # The order follows the view, as a full sync would give
+    assert [r["id"] for r in snapshot.ordered_records()] == ["rec4", "rec3", "rec1", "rec2"]
+    assert [r["id"] for r in sync(url, tmp_path, full=True).ordered_records()] == ["rec4", "rec3", "rec1", "rec2"]
+
+
+def test_incremental_sync_drops_records_that_left_the_view(airtable, tmp_path):
+    fake, url, server = airtable
+    sync(url, tmp_path)
+    server.requests.clear()
+
+    del fake.view[0]
+    snapshot = sync(url, tmp_path)
+
+    listings = [q for _, q in server.requests if "fields[]" in q]
+    assert listings and all(q["fields[]"] == [ID_LISTING_FIELD] for q in listings)
+    assert [r["id"] for r in snapshot.ordered_records()] == ["rec1", "rec2"]
+    assert set(AirtableSnapshot("base", "Table 1", "Active Members", str(tmp_path)).records) == {"rec1", "rec2"}
+
+
+def test_offline_uses_the_snapshot_without_requests(airtable, tmp_path):
+    fake, url, server = airtable
+    with pytest.raises(FileNotFoundError):
+        sync(url, tmp_path, offline=True)
+    sync(url, tmp_path)
+    server.requests.clear()
+
+    fake.view.clear()
+    snapshot = sync(url, tmp_path, offline=True)
+
+    assert server.requests == []
+    assert [r["id"] for r in snapshot.ordered_records()] == ["rec3", "rec1", "rec2"]
+
+
+def test_members_are_loaded_in_view_order(airtable, tmp_path, monkeypatch):
+    fake, url, server = airtable
+    monkeypatch.setenv("AIRTABLE_ACCESS_TOKEN", "token")
+    club = Club()
+
+    club.load_members_from_airtable("base", "Table 1", "Active Members", cache_dir=str(tmp_path), base_url=url,
+                                    session=requests.Session())
+    assert [m.first_name for m in club.members.values()] == ["Cara", "Ann", "Bea"]
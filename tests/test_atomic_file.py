@@ -0,0 +1,28 @@
+import pytest
+
+from atomic_file import atomic_write
+
+
+def test_atomic_write_replaces_the_file(tmp_path):
+    path = tmp_path / 'nested' / 'state.json'
+
+    with atomic_write(str(path)) as f:
+        f.write('first')
+    with atomic_write(str(path)) as f:
+        f.write('second')
+
+    assert path.read_text() == 'second'
+    assert [p.name for p in path.parent.iterdir()] == ['state.json']
+
+
+def test_failed_write_leaves_the_old_file(tmp_path):
+    path = tmp_path / 'state.json'
+    path.write_text('old')
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path), 'wb') as f:
+            f.write(b'half')
+            raise RuntimeError("interrupted")
+
+    assert path.read_text() == 'old'
+    assert [p.name for p in tmp_path.iterdir()] == ['state.json']
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+import parse
+from parse import extract_results_from_raceresult
+
+FIELDS = ['BIB', 'WithStatus([AUTORANK.p])', 'FLNAME', 'Finish.GUN', 'PACE', 'GenderMF', 'AGE', 'CITY', 'STATE2']
+
+
+def write_export(path, count=300, data_first=False):
+    data = []
+    for i in range(count):
+        name = f"Last{i}, First{i}" if i % 2 else f"First{i} Last{i}"
+        row = [str(100 + i), f"{i + 1}.", name, f"{20 + i // 60}:{i % 60:02d}", "6:30", 'MF'[i % 2],
+               '' if i % 11 == 0 else str(20 + i % 50), "Rochester", "MN"]
+        if i % 97 == 0:
+            row = row[:5]
+        data.append(row)
+    document = {'data': data, 'DataFields': FIELDS} if data_first else {'list': {}, 'DataFields': FIELDS, 'data': data}
+    with open(path, 'w') as f:
+        json.dump(document, f)
+    return str(path)
+
+
+def as_tuples(results):
+    return [(r.place, r.name, r.time, r.pace, r.age, r.gender, r.city, r.state) for r in results]
+
+
+def test_rows_are_converted_with_defaults(tmp_path):
+    results = extract_results_from_raceresult(write_export(tmp_path / 'race.json'), 'Female', stream=False)
+
+    assert len(results) == 300
+    assert as_tuples(results[:2]) == [
+        (1, 'First0 Last0', '20:00', '6:30', None, 'Female', '', ''),
+        (2, 'First1 Last1', '20:01', '6:30', 21, 'F', 'Rochester', 'MN'),
+    ]
+
+
+@pytest.mark.parametrize('data_first', [False, True])
+def test_streamed_results_match_loaded_results(tmp_path, data_first):
+    pytest.importorskip("ijson")
+    path = write_export(tmp_path / 'race.json', data_first=data_first)
+
+    loaded = extract_results_from_raceresult(path, 'Female', stream=False)
+    streamed = extract_results_from_raceresult(path, 'Female', stream=True)
+
+    assert as_tuples(streamed) == as_tuples(loaded)
+
+
+def test_large_exports_are_streamed(tmp_path, monkeypatch):
+    pytest.importorskip("ijson")
+    path = write_export(tmp_path / 'race.json')
+    loaded = extract_results_from_raceresult(path, stream=False)
+
+    def no_load(*args, **kwargs):
+        raise AssertionError("the export should have been streamed")
+
+    monkeypatch.setattr(parse, 'RACERESULT_STREAM_BYTES', 1)
+    monkeypatch.setattr(parse.json, 'load', no_load)
+
+    assert as_tuples(extract_results_from_raceresult(path)) == as_tuples(loaded)
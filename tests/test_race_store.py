@@ -0,0 +1,17 @@
+import race_store
+from race_store import race_key
+
+ENTRY = {'name': 'Race 1', 'file': 'race1.json', 'results_type': 'raceresult'}
+
+
+def test_race_key_changes_with_the_parser_version(monkeypatch):
+    key = race_key(ENTRY, 0, [], 'roster')
+    assert race_key(ENTRY, 0, [], 'roster') == key
+
+    monkeypatch.setattr(race_store, 'PARSER_VERSION', race_store.PARSER_VERSION + 1)
+
+    assert race_key(ENTRY, 0, [], 'roster') != key
+
+
+def test_race_key_changes_with_the_roster():
+    assert race_key(ENTRY, 0, [], 'roster') != race_key(ENTRY, 0, [], 'other roster')
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from scrape_athlinks import AthlinksFetcher, fetch_all_race_results
+
+TOTAL = 537
+
+
+def results_page(query):
+    start = int(query['from'][0])
+    limit = int(query['limit'][0])
+    return {
+        "division": {"totalAthletes": TOTAL},
+        "intervals": [{"results": [{"bib": i} for i in range(start, min(TOTAL, start + limit))]}],
+    }
+
+
+def flaky(failures):
+    """
+    Responds with the given statuses to the first requests for each page offset, then with the page.
+    """
+    seen = {}
+
+    def respond(path, query):
+        start = int(query['from'][0])
+        attempt = seen.get(start, 0)
+        seen[start] = attempt + 1
+        statuses = failures.get(start, [])
+        if attempt < len(statuses):
+            return statuses[attempt], {"error": "try again"}
+        return 200, results_page(query)
+    return respond
+
+
+def test_fetch_all_pages_in_order(stub_server, tmp_path):
+    url = stub_server(flaky({}))
+    fetcher = AthlinksFetcher(1, 2, limit=100, cache_dir=str(tmp_path), base_url=url)
+
+    results = fetcher.fetch_all()
+
+    assert [r['bib'] for r in results] == list(range(TOTAL))
+    assert sorted(int(q['from'][0]) for _, q in stub_server.requests) == [0, 100, 200, 300, 400, 500]
+    assert all(path == '/event/1/race/2/results' for path, _ in stub_server.requests)
+
+
+def test_retries_rate_limits_and_server_errors(stub_server, tmp_path):
+    url = stub_server(flaky({0: [429], 200: [503, 502]}))
+    fetcher = AthlinksFetcher(1, 2, limit=100, backoff=0.001, cache_dir=str(tmp_path), base_url=url)
+
+    results = fetcher.fetch_all()
+
+    assert [r['bib'] for r in results] == list(range(TOTAL))
+    assert len(stub_server.requests) == 6 + 3
+
+
+def test_gives_up_after_retries(stub_server, tmp_path):
+    url = stub_server(flaky({0: [500] * 10}))
+    fetcher = AthlinksFetcher(1, 2, retries=2, backoff=0.001, cache_dir=str(tmp_path), base_url=url)
+
+    with pytest.raises(Exception, match='500'):
+        fetcher.fetch_all()
+    assert len(stub_server.requests) == 3
+
+
+def test_client_errors_are_not_retried(stub_server, tmp_path):
+    url = stub_server(flaky({0: [404] * 10}))
+    fetcher = AthlinksFetcher(1, 2, backoff=0.001, cache_dir=str(tmp_path), base_url=url)
+
+    with pytest.raises(Exception, match='404'):
+        fetcher.fetch_all()
+    assert len(stub_server.requests) == 1
+
+
+def test_cached_pages_are_reused(stub_server, tmp_path):
+    url = stub_server(flaky({}))
+    cache_dir = str(tmp_path / 'cache')
+    output = tmp_path / 'results.json'
+
+    first = fetch_all_race_results(1, 2, str(output), cache_dir=cache_dir, base_url=url)
+    fetched = len(stub_server.requests)
+    second = fetch_all_race_results(1, 2, str(output), cache_dir=cache_dir, base_url=url)
+
+    assert second == first
+    assert len(stub_server.requests) == fetched
+    assert json.loads(output.read_text()) == first
+
+    AthlinksFetcher(1, 2, cache_dir=cache_dir, refresh=True, base_url=url).fetch_all()
+    assert len(stub_server.requests) == 2 * fetched
@@ -0,0 +1,74 @@
+from datetime import date, datetime
+
+from member import Club, Member
+from parse import Result
+
+YEAR = date.today().year
+
+
+def make_member(first, last, birth_date, gender='F'):
+    return Member(f'{YEAR}-01-15', first, last, birth_date, gender, 'Renew 1 Year', start_year=YEAR, end_year=YEAR)
+
+
+def scored(member, race_index, points):
+    result = Result(1, f"{member.first_name} {member.last_name}", '20:00', '6:27', 40, member.gender, '', '')
+    result.set_race_index(race_index)
+    result.points = points
+    result.member = member
+    return result
+
+
+def make_club():
+    club = Club()
+    for member in (make_member('Ann', 'Berg', datetime(1985, 5, 1)), make_member('Bea', 'Lund', datetime(1986, 7, 2))):
+        club.members[member.name] = member
+    return club
+
+
+def totals(standings):
+    return {entry['name']: (entry['total_best_5'], entry['place']) for entry in standings.entries}
+
+
+def test_standings_change_after_a_second_race_is_credited():
+    club = make_club()
+    ann, bea = club.members.values()
+    club.add_result(ann, scored(ann, 0, 10))
+    club.add_result(bea, scored(bea, 0, 8))
+    first = club.standings()
+    assert totals(first) == {'Ann Berg': (10, 1), 'Bea Lund': (8, 2)}
+    assert club.standings() is first
+
+    club.add_result(bea, scored(bea, 1, 9))
+    second = club.standings()
+
+    assert second is not first
+    assert second.race_count == 2
+    assert totals(second) == {'Ann Berg': (10, 2), 'Bea Lund': (17, 1)}
+
+
+def test_crediting_a_member_directly_refreshes_standings():
+    club = make_club()
+    ann, bea = club.members.values()
+    club.add_result(ann, scored(ann, 0, 10))
+    assert [entry['name'] for entry in club.standings().entries] == ['Ann Berg']
+
+    bea.add_result(scored(bea, 0, 12))
+
+    assert totals(club.standings()) == {'Ann Berg': (10, 2), 'Bea Lund': (12, 1)}
+
+
+def test_division_changes_refresh_standings():
+    club = make_club()
+    ann, bea = club.members.values()
+    club.add_result(ann, scored(ann, 0, 10))
+    club.add_result(bea, scored(bea, 0, 8))
+    assert len(club.standings().divisions) == 1
+
+    # A merge that fills in a birth date sets the member's division again
+    bea.birth_date = datetime(1960, 7, 2)
+    bea.set_division()
+
+    divisions = club.standings().divisions
+    assert {division: [entry['name'] for entry in entries] for division, entries in divisions.items()} == {
+        ann.division: ['Ann Berg'], bea.division: ['Bea Lund']}
+    assert [entry['place'] for entries in divisions.values() for entry in entries] == [1, 1]
@@ -0,0 +1,210 @@
+import re
+
+import pytest
+
+from parse import Result
+from upload import HEADER, SheetsUploader, diff_rows, race_rows
+
+
+class Request:
+    def __init__(self, run):
+        self.run = run
+
+    def execute(self):
+        return self.run()
+
+
+class FakeSheets:
+    """
+    In-memory stand-in for the Sheets API service, holding each sheet as a dict of cells.
+    Every call is recorded in calls by name.
+    """
+    def __init__(self):
+        self.sheets = {}
+        self.calls = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return FakeValues(self)
+
+    def get(self, spreadsheetId, fields=None):
+        self.calls.append('get')
+        return Request(lambda: {'sheets': [{'properties': {'title': title, 'sheetId': sheet['id']}}
+                                           for title, sheet in self.sheets.items()]})
+
+    def batchUpdate(self, spreadsheetId, body):
+        self.calls.append('batchUpdate')
+
+        def run():
+            replies = []
+            for request in body['requests']:
+                title = request['addSheet']['properties']['title']
+                assert title not in self.sheets
+                self.sheets[title] = {'id': len(self.sheets) + 1, 'cells': {}}
+                replies.append({'addSheet': {'properties': {'title': title, 'sheetId': self.sheets[title]['id']}}})
+            return {'replies': replies}
+        return Request(run)
+
+    def rows(self, title):
+        """
+        Returns a sheet's values as the API reads them back: trailing empty rows and cells dropped.
+        """
+        cells = {key: value for key, value in self.sheets[title]['cells'].items() if value != ''}
+        rows = [[] for _ in range(1 + max((row for row, _ in cells), default=-1))]
+        for (row, col), value in sorted(cells.items()):
+            rows[row] += [''] * (col - len(rows[row])) + [value]
+        return rows
+
+
+def parse_range(a1):
+    # "'Title'!B3:C4", "'Title'!A1" or "'Title'!A:H" -> (title, first row, first column), 0-based
+    title, column, row = re.fullmatch(r"'((?:[^']|'')*)'!([A-Z]+)(\d*)(?::[A-Z]+\d*)?", a1).groups()
+    index = 0
+    for letter in column:
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return title.replace("''", "'"), int(row or 1) - 1, index - 1
+
+
+class FakeValues:
+    def __init__(self, service):
+        self.service = service
+
+    def batchUpdate(self, spreadsheetId, body):
+        self.service.calls.append('values.batchUpdate')
+        self.service.last_update = body
+
+        def run():
+            written = 0
+            for value_range in body['data']:
+                title, first_row, first_col = parse_range(value_range['range'])
+                cells = self.service.sheets[title]['cells']
+                for i, row in enumerate(value_range['values']):
+                    for j, value in enumerate(row):
+                        cells[(first_row + i, first_col + j)] = value
+                        written += 1
+            return {'totalUpdatedCells': written}
+        return Request(run)
+
+    def batchGet(self, spreadsheetId, ranges, majorDimension='ROWS'):
+        self.service.calls.append('values.batchGet')
+
+        def run():
+            value_ranges = []
+            for a1 in ranges:
+                rows = self.service.rows(parse_range(a1)[0])
+                value_ranges.append({'range': a1, 'values': rows} if rows else {'range': a1})
+            return {'valueRanges': value_ranges}
+        return Request(run)
+
+
+def finishers(count, offset=0):
+    results = []
+    for i in range(count):
+        result = Result(i + 1, f"Runner {i + offset}", f"20:{i % 60:02d}", "6:30", 20 + i % 50, 'MF'[i % 2],
+                        "Rochester", "MN")
+        result.set_division()
+        results.append(result)
+    return results
+
+
+@pytest.fixture
+def service():
+    return FakeSheets()
+
+
+def test_season_upload_adds_sheets_and_writes_in_one_batch(service, tmp_path):
+    service.sheets['Race1'] = {'id': 1, 'cells': {}}
+    season = [("Race 1", finishers(30)), ("Race 2", finishers(20)), ("Race 3", finishers(10))]
+
+    written = SheetsUploader(service, 'sheet-id', str(tmp_path)).upload_season(season)
+
+    assert written == ['Race1', 'Race2', 'Race3']
+    assert service.calls == ['get', 'batchUpdate', 'values.batchUpdate']
+    for race_name, results in season:
+        assert service.rows(race_name.replace(' ', '')) == race_rows(results)
+        assert service.rows(race_name.replace(' ', ''))[0] == HEADER
+
+
+def test_unchanged_races_are_skipped(service, tmp_path):
+    season = [("Race 1", finishers(30)), ("Race 2", finishers(20))]
+    SheetsUploader(service, 'sheet-id', str(tmp_path)).upload_season(season)
+    service.calls.clear()
+
+    uploader = SheetsUploader(service, 'sheet-id', str(tmp_path))
+    assert uploader.upload_season(season) == []
+    assert service.calls == ['get']
+
+    season[1][1][4].division = 'F9099'
+    assert uploader.upload_season(season) == ['Race2']
+    assert service.calls == ['get', 'values.batchUpdate']
+    assert [d['range'] for d in service.last_update['data']] == ["'Race2'!A1"]
+    assert service.rows('Race2') == race_rows(season[1][1])
+
+
+def test_shorter_upload_blanks_leftover_rows(service, tmp_path):
+    uploader = SheetsUploader(service, 'sheet-id', str(tmp_path))
+    uploader.upload_season([("Race 1", finishers(30))])
+
+    shorter = finishers(25)
+    uploader.upload_season([("Race 1", shorter)])
+
+    assert service.rows('Race1') == race_rows(shorter)
+
+
+def test_sync_writes_only_the_changed_cells(service, tmp_path):
+    uploader = SheetsUploader(service, 'sheet-id', str(tmp_path))
+    results = finishers(40)
+    uploader.upload_season([("Race 1", results)], sync=True)
+    service.calls.clear()
+
+    results[7].division = 'M9099'
+    del results[20]
+    SheetsUploader(service, 'sheet-id', str(tmp_path)).upload_season([("Race 1", results)], sync=True)
+
+    assert service.calls == ['get', 'values.batchGet', 'values.batchUpdate']
+    ranges = [d['range'] for d in service.last_update['data']]
+    # The division cell of row 9, rows 22-40 moved up a place, and the old last row blanked
+    assert ranges == ["'Race1'!C9:C9", "'Race1'!A22:H41"]
+    assert service.last_update['data'][1]['values'][-1] == [''] * len(HEADER)
+    assert service.rows('Race1') == race_rows(results)
+
+
+def test_sync_of_a_new_sheet_writes_it_whole(service, tmp_path):
+    results = finishers(5)
+    SheetsUploader(service, 'sheet-id', str(tmp_path)).upload_season([("Race 1", results)], sync=True)
+
+    assert service.calls == ['get', 'batchUpdate', 'values.batchUpdate']
+    assert service.rows('Race1') == race_rows(results)
+
+
+def test_diff_rows_blanks_rows_past_a_shorter_sheet():
+    current = [['1', 'Ann', 'F3039'], ['2', 'Bea', 'F3039'], ['3', 'Cara', 'F4049']]
+    new = [['1', 'Ann', 'F3039']]
+
+    assert diff_rows(current, new, width=3) == [(1, 0, [['', '', ''], ['', '', '']])]
+
+
+def test_diff_rows_pads_trailing_empty_cells_missing_from_current():
+    # The API drops trailing empty cells, so a row read back as ['1', 'Ann'] equals ['1', 'Ann', '']
+    current = [['1', 'Ann'], ['2', 'Bea', 'F3039']]
+    new = [['1', 'Ann', ''], ['2', 'Bea', '']]
+
+    assert diff_rows(current, new, width=3) == [(1, 2, [['']])]
+    assert diff_rows([['1', 'Ann']], [['1', 'Ann', 'F3039']], width=3) == [(0, 2, [['F3039']])]
+
+
+def test_diff_rows_rewrites_whole_rows_when_the_finisher_changes():
+    current = [['1', 'Ann', 'F3039'], ['2', 'Bea', 'F3039'], ['3', 'Cara', 'F4049']]
+    new = [['1', 'Ann', 'F4049'], ['2', 'Cara', 'F4049'], ['3', 'Bea', 'F3039']]
+
+    assert diff_rows(current, new, width=3) == [
+        (0, 2, [['F4049']]),
+        (1, 0, [['2', 'Cara', 'F4049'], ['3', 'Bea', 'F3039']]),
+    ]
+
+
+def test_diff_rows_of_equal_rows_is_empty():
+    rows = [['1', 'Ann', 'F3039']]
+    assert diff_rows(rows, [list(row) for row in rows], width=3) == []
@@ -1,119 +1,309 @@
-from googleapiclient.discovery import build
-from pydrive2.auth import GoogleAuth
-from pydrive2.drive import GoogleDrive
-from dotenv import load_dotenv
+import argparse
+import hashlib
+import json
 import os
-from parse import extract_results_from_pdf
 
-def create_sheet(new_sheet_name, spreadsheet_id, service):
-    # Retrieve spreadsheet metadata to list existing sheets
-    spreadsheet_metadata = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-    sheets = spreadsheet_metadata.get('sheets', [])
+from atomic_file import atomic_write
+from match_cache import DEFAULT_CACHE_DIR
 
-    sheet_names = [sheet['properties']['title'] for sheet in sheets]
-    if new_sheet_name in sheet_names:
-        print(f"Sheet {new_sheet_name} already exists. No need to create it.")
+HEADER = ['Place', 'Name', 'Division', 'Time', 'Age', 'Gender', 'City', 'State']
 
-    else:
-        requests = [{
-            "addSheet": {
-                "properties": {
-                    "title": new_sheet_name
-                }
-            }
-        }]
-
-        body = {
-            "requests": requests
-        }
-
-        service.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body=body
+
+def sheet_title(race_name: str) -> str:
+    return race_name.replace(" ", "")
+
+
+def a1_range(title: str, cell: str = 'A1') -> str:
+    # Quote the sheet name so titles with punctuation still parse
+    return "'{}'!{}".format(title.replace("'", "''"), cell)
+
+
+def race_rows(results) -> list[list[str]]:
+    """
+    Returns the sheet rows for a race: the header, then one row per result.
+    """
+    rows = [list(HEADER)]
+    for r in results:
+        rows.append([
+            str(r.place),
+            r.name,
+            r.division or '',
+            r.time,
+            '' if r.age is None else str(r.age),
+            r.gender or '',
+            r.city or '',
+            r.state or '',
+        ])
+    return rows
+
+
+def rows_digest(rows) -> str:
+    return hashlib.sha256(json.dumps(rows, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def column_letter(index: int) -> str:
+    # 0 -> A, 25 -> Z, 26 -> AA
+    letters = ''
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+
+def diff_rows(current, new, width=len(HEADER)):
+    """
+    Works out the cells to write to turn the rows on a sheet into new rows.
+
+    Rows are compared position by position. A row that still holds the same finisher (same
+    place and name) only has the span of cells that changed rewritten, e.g. just a corrected
+    division. Any other changed row is rewritten whole, and rows past the end of new are
+    blanked. Consecutive rows with the same changed span are merged into one block.
+
+    Parameters:
+        current (list): Rows as read back from the sheet; trailing empty cells may be missing.
+        new (list): Rows that should be on the sheet.
+        width (int): Number of columns.
+
+    Returns:
+        list: (first row, first column, values) blocks, with 0-based row and column indexes.
+    """
+    def padded(rows, i):
+        row = list(rows[i]) if i < len(rows) else []
+        return row + [''] * (width - len(row))
+
+    blocks = []
+    for i in range(max(len(current), len(new))):
+        old, row = padded(current, i), padded(new, i)
+        if old == row:
+            continue
+        if i < len(current) and i < len(new) and old[:2] == row[:2]:
+            changed = [j for j in range(width) if old[j] != row[j]]
+            first, last = changed[0], changed[-1]
+        else:
+            first, last = 0, width - 1
+
+        previous = blocks[-1] if blocks else None
+        if previous and previous[0] + len(previous[3]) == i and previous[1:3] == [first, last]:
+            previous[3].append(row[first:last + 1])
+        else:
+            blocks.append([i, first, last, [row[first:last + 1]]])
+
+    return [(i, first, values) for i, first, _, values in blocks]
+
+
+class SheetsUploader:
+    """
+    Publishes race results to a Google Sheets spreadsheet, one sheet per race.
+
+    A season is uploaded with at most one spreadsheets().batchUpdate (adding every missing
+    sheet) and one values().batchUpdate (writing every changed race). The sheet list is read
+    once and cached. A digest of each race's rows is kept in a local state file, so races whose
+    content hasn't changed since the last upload are skipped.
+
+    Parameters:
+        service: Sheets API service, as returned by build_service (or a fake with the same methods).
+        spreadsheet_id (str): ID of the Grand Prix spreadsheet.
+        state_dir (str): Directory holding the upload state file.
+    """
+    def __init__(self, service, spreadsheet_id, state_dir=os.path.join(DEFAULT_CACHE_DIR, 'sheets')):
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.state_path = os.path.join(state_dir, f"{spreadsheet_id}.json")
+        self._sheet_ids = None
+
+        # Sheet title -> {'digest': digest of the uploaded rows, 'rows': number of rows written}
+        self.state = {}
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                self.state = json.load(f)
+
+    def sheet_ids(self, refresh=False) -> dict:
+        """
+        Returns sheet title -> sheetId for the spreadsheet, fetching the sheet list only once.
+        """
+        if self._sheet_ids is None or refresh:
+            metadata = self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties(sheetId,title)'
+            ).execute()
+            self._sheet_ids = {sheet['properties']['title']: sheet['properties']['sheetId']
+                               for sheet in metadata.get('sheets', [])}
+        return self._sheet_ids
+
+    def _save_state(self):
+        with atomic_write(self.state_path) as f:
+            json.dump(self.state, f, indent=2)
+
+    def _current_values(self, titles) -> dict:
+        """
+        Reads the values on several sheets in one request. Returns title -> rows.
+        """
+        response = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=[a1_range(title, f"A:{column_letter(len(HEADER) - 1)}") for title in titles],
+            majorDimension='ROWS'
         ).execute()
+        return {title: value_range.get('values', [])
+                for title, value_range in zip(titles, response.get('valueRanges', []))}
 
-# Load environment variables from .env
-load_dotenv()
+    def upload_season(self, races, sync=False) -> list[str]:
+        """
+        Uploads every race whose rows changed since the last upload.
 
-# Get the client secret path from the .env file
-client_secret_path = os.getenv("CLIENT_SECRET")
-if client_secret_path is None:
-    raise Exception("Need a client secret file!")
+        Parameters:
+            races (list): (race name, list of Results) for each race of the season.
+            sync (bool): Read back the existing sheets of changed races (in one batchGet) and
+                write only the cells that differ, instead of rewriting each sheet from A1.
 
-creds_file = os.getenv("CREDS_LOCATION")
-if creds_file is None:
-    raise Exception("Need a credentials file!")
+        Returns:
+            list[str]: Titles of the sheets that were written.
+        """
+        sheet_ids = self.sheet_ids()
+        changed = []
+        for race_name, results in races:
+            title = sheet_title(race_name)
+            rows = race_rows(results)
+            digest = rows_digest(rows)
+            previous = self.state.get(title)
+            if title in sheet_ids and previous is not None and previous['digest'] == digest:
+                continue
+            changed.append((title, rows, digest))
 
-# Initialize GoogleAuth instance
-gauth = GoogleAuth()
+        if not changed:
+            print("All race sheets are up to date.")
+            return []
 
-# Specify the path to the client secrets file dynamically
-gauth.settings["client_config_file"] = client_secret_path
+        # Create all missing sheets in one round trip
+        missing = [title for title, _, _ in changed if title not in sheet_ids]
+        if missing:
+            reply = self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={"requests": [{"addSheet": {"properties": {"title": title}}} for title in missing]}
+            ).execute()
+            for response in reply.get('replies', []):
+                properties = response['addSheet']['properties']
+                sheet_ids[properties['title']] = properties['sheetId']
 
-# Check for saved credentials or authenticate and save new ones
-if os.path.exists(creds_file):
-    gauth.LoadCredentialsFile(creds_file)
-    if gauth.access_token_expired:
-        gauth.Refresh()
-else:
-    gauth.LocalWebserverAuth()  # Authenticate and create credentials
-    gauth.SaveCredentialsFile(creds_file)  # Save credentials for reuse
+        current = {}
+        if sync:
+            existing = [title for title, _, _ in changed if title not in missing]
+            if existing:
+                current = self._current_values(existing)
 
-# Initialize Google Drive instance with authenticated credentials
-drive = GoogleDrive(gauth)
-creds = gauth.credentials
+        # Write every changed race in one round trip
+        data = []
+        for title, rows, _ in changed:
+            if title in current:
+                for row, col, values in diff_rows(current[title], rows):
+                    cells = (f"{column_letter(col)}{row + 1}:"
+                             f"{column_letter(col + len(values[0]) - 1)}{row + len(values)}")
+                    data.append({'range': a1_range(title, cells), 'majorDimension': 'ROWS', 'values': values})
+                continue
 
-# Build the Sheets API service
-service = build('sheets', 'v4', credentials=creds)
+            # Rows left over from a longer previous upload are blanked out
+            previous = self.state.get(title) if title not in missing else None
+            stale = (previous['rows'] - len(rows)) if previous else 0
+            values = rows + [[''] * len(HEADER) for _ in range(max(stale, 0))]
+            data.append({'range': a1_range(title), 'majorDimension': 'ROWS', 'values': values})
 
-# Get file from name in .env
-grand_prix_filename = os.getenv("GRAND_PRIX_FILENAME")
-file_list = drive.ListFile({'q': f"'root' in parents and trashed=false and title = '{grand_prix_filename}'"}).GetList()
+        response = {}
+        if data:
+            response = self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={'valueInputOption': 'RAW', 'data': data}
+            ).execute()
 
-if not file_list or len(file_list) == 0:
-    raise Exception(f"Could not find file named {grand_prix_filename} in Google Drive")
+        for title, rows, digest in changed:
+            self.state[title] = {'digest': digest, 'rows': len(rows)}
+        self._save_state()
 
-gp_file = file_list[0]
+        print(f"Updated {len(changed)} sheets ({len(missing)} new) with {len(data)} ranges, "
+              f"{response.get('totalUpdatedCells', 0)} cells written.")
+        return [title for title, _, _ in changed]
 
 
-results_path = "/home/joseph/Downloads/SpringClassic2024Results15k.pdf"
-race_name = "2024 Spring Classic"
-results = extract_results_from_pdf(results_path)
+def build_service():
+    """
+    Authenticates with Google and returns (Sheets service, Drive client). Paths to the client
+    secret and saved credentials come from the .env file.
+    """
+    from googleapiclient.discovery import build
+    from pydrive2.auth import GoogleAuth
+    from pydrive2.drive import GoogleDrive
+    from dotenv import load_dotenv
 
-new_data = [
-         ['Name', 'Division', 'Time', 'Age', 'Sex', 'City', 'State'] 
-        ]
+    # Load environment variables from .env
+    load_dotenv()
 
-for r in results:
-    new_data.append([
-        r.name,
-        r.division,
-        r.time,
-        str(r.age),
-        r.sex,
-        r.city,
-        r.state
-        ])
+    # Get the client secret path from the .env file
+    client_secret_path = os.getenv("CLIENT_SECRET")
+    if client_secret_path is None:
+        raise Exception("Need a client secret file!")
+
+    creds_file = os.getenv("CREDS_LOCATION")
+    if creds_file is None:
+        raise Exception("Need a credentials file!")
+
+    # Initialize GoogleAuth instance
+    gauth = GoogleAuth()
+
+    # Specify the path to the client secrets file dynamically
+    gauth.settings["client_config_file"] = client_secret_path
+
+    # Check for saved credentials or authenticate and save new ones
+    if os.path.exists(creds_file):
+        gauth.LoadCredentialsFile(creds_file)
+        if gauth.access_token_expired:
+            gauth.Refresh()
+    else:
+        gauth.LocalWebserverAuth()  # Authenticate and create credentials
+        gauth.SaveCredentialsFile(creds_file)  # Save credentials for reuse
+
+    # Initialize Google Drive instance with authenticated credentials
+    drive = GoogleDrive(gauth)
+
+    # Build the Sheets API service
+    service = build('sheets', 'v4', credentials=gauth.credentials)
+    return service, drive
+
+
+def find_spreadsheet_id(drive, filename):
+    file_list = drive.ListFile({'q': f"'root' in parents and trashed=false and title = '{filename}'"}).GetList()
+
+    if not file_list or len(file_list) == 0:
+        raise Exception(f"Could not find file named {filename} in Google Drive")
+
+    return file_list[0]['id']
+
+
+def main(argv=None):
+    from gp import load_gp_data, race_files, DEFAULT_RACES_YAML, DEFAULT_INGEST_LOCATION
+    from parse import extract_results
 
+    parser = argparse.ArgumentParser(description="Upload a season's race results to the Grand Prix spreadsheet")
+    parser.add_argument('--races', default=DEFAULT_RACES_YAML, help="Season YAML listing the races")
+    parser.add_argument('--ingest', default=DEFAULT_INGEST_LOCATION, help="Directory holding the results files")
+    parser.add_argument('--sync', action='store_true',
+                        help="Read the existing sheets and write only the cells that changed")
+    args = parser.parse_args(argv)
 
+    races, _, _ = load_gp_data(args.races)
+    season = []
+    for race_index, race in enumerate(races):
+        results = []
+        for path, gender in race_files(race, args.ingest):
+            results += extract_results(race, race_index, path, gender=gender)
+        for r in results:
+            r.set_division()
+        season.append((race.name, results))
 
-# Create a new sheet for the race
-race_condensed_name = race_name.replace(" ", "")
-create_sheet(race_condensed_name, gp_file['id'], service)
+    service, drive = build_service()
 
-# Create request to fill out the sheet
-range_name = f'{race_condensed_name}!A1'
-update_body = {
-    'range': range_name,
-    'majorDimension': 'ROWS',
-    'values': new_data
-}
+    # Get file from name in .env
+    spreadsheet_id = find_spreadsheet_id(drive, os.getenv("GRAND_PRIX_FILENAME"))
+    SheetsUploader(service, spreadsheet_id).upload_season(season, sync=args.sync)
 
-response = service.spreadsheets().values().update(
-    spreadsheetId=gp_file['id'],
-    range=range_name,
-    valueInputOption='RAW',
-    body=update_body
-).execute()
 
-print(f"Spreadsheet updated! Response: {response}")
+if __name__ == '__main__':
+    main()